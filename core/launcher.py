@@ -91,18 +91,16 @@ class GameLauncher:
             for genre, game_list in sorted(genres.items()):
                 genre_menu = Menu(f"{genre.upper()} GAMES")
                 
-                for plugin_id, info in sorted(game_list, key=lambda x: x[1].metadata.get('name', '')):
-                    name = info.metadata.get('name', plugin_id)
-                    description = info.metadata.get('description', '')
-                    
-                    # Create game selection item
-                    game_item = MenuItem(
-                        name,
+                # Create game selection items
+                genre_menu.extend_items(
+                    MenuItem(
+                        info.metadata.get('name', plugin_id),
                         MenuAction.CUSTOM,
                         ('play_game', plugin_id),
-                        description
+                        info.metadata.get('description', '')
                     )
-                    genre_menu.add_item(game_item)
+                    for plugin_id, info in sorted(game_list, key=lambda x: x[1].metadata.get('name', ''))
+                )
                 
                 genre_menu.add_back()
                 games_menu.add_submenu(genre, genre_menu)
@@ -17,9 +17,35 @@ class Direction(Enum):
     LEFT = (-1, 0)
     RIGHT = (1, 0)
 
+# Integer-indexed direction tables for the per-tick hot path
+_DIRECTIONS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+_DIR_IDX = {direction: i for i, direction in enumerate(_DIRECTIONS)}
+_DIR_DELTA = ((0, -1), (0, 1), (-1, 0), (1, 0))
+_HEAD_CHAR = ('▲', '▼', '◄', '►')
+_OPPOSITE_IDX = (1, 0, 3, 2)
+_KEY_TO_DIR = {
+    curses.KEY_UP: 0, ord('w'): 0, ord('W'): 0,
+    curses.KEY_DOWN: 1, ord('s'): 1, ord('S'): 1,
+    curses.KEY_LEFT: 2, ord('a'): 2, ord('A'): 2,
+    curses.KEY_RIGHT: 3, ord('d'): 3, ord('D'): 3,
+}
+
 class SnakeGame(BaseGame):
     """Classic Snake game with multiple modes and difficulty levels."""
     
+    # Pause overlay box, built once at class creation
+    _PAUSE_TEXT = (
+        "╔" + "═" * 20 + "╗",
+        "║" + " " * 20 + "║",
+        "║" + "PAUSED".center(20) + "║",
+        "║" + " " * 20 + "║",
+        "║" + "Press P to".center(20) + "║",
+        "║" + "resume".center(20) + "║",
+        "║" + " " * 20 + "║",
+        "╚" + "═" * 20 + "╝"
+    )
+    _PAUSE_HEIGHT = len(_PAUSE_TEXT)
+    
     def __init__(self):
         super().__init__()
         self.name = "Snake Classic"
@@ -46,9 +72,11 @@ class SnakeGame(BaseGame):
         self.snake = []
         self.direction = Direction.RIGHT
         self.next_direction = Direction.RIGHT
+        self._dir_idx = _DIR_IDX[Direction.RIGHT]
+        self._next_dir_idx = self._dir_idx
         self.food_pos = (0, 0)
         self.special_food = None
-        self.special_food_timer = 0
+        self.special_food_expiry = 0
         self.width = 0
         self.height = 0
         self.game_speed = 100  # milliseconds between updates
@@ -60,6 +88,8 @@ class SnakeGame(BaseGame):
         self.start_time = 0
         self.time_limit = 0
         self.last_update = 0
+        self._dirty = True
+        self._last_render_time = 0
         
     def run(self, screen, mode=GameMode.NORMAL, **kwargs):
         """Main game loop."""
@@ -71,21 +101,24 @@ class SnakeGame(BaseGame):
         
         # Game loop
         self.running = True
-        clock = time.time()
+        clock = time.monotonic()
         
         while self.running and not self.game_over:
-            current_time = time.time()
+            current_time = time.monotonic()
             
             # Handle input
             self._handle_game_input(screen)
             
             # Update game state (at game speed)
             if current_time - self.last_update >= self.game_speed / 1000.0:
-                self._update()
+                self._update(current_time)
                 self.last_update = current_time
             
-            # Render
-            self._render(screen)
+            # Render only when state changed (and once per second for the timer)
+            if self._dirty or current_time - self._last_render_time >= 1.0:
+                self._render(screen, current_time)
+                self._dirty = False
+                self._last_render_time = current_time
             
             # Small delay to prevent CPU hogging
             time.sleep(0.01)
@@ -93,6 +126,11 @@ class SnakeGame(BaseGame):
         self.cleanup_screen(screen)
         return self.score
     
+    def setup_screen(self, screen):
+        """Setup the screen with fully non-blocking input."""
+        super().setup_screen(screen)
+        screen.nodelay(True)  # getch returns -1 immediately when the queue is empty
+    
     def _initialize_game(self, mode, **kwargs):
         """Initialize game state."""
         self.game_over = False
@@ -102,6 +140,14 @@ class SnakeGame(BaseGame):
         self.food_eaten = 0
         self.level = 1
         self.current_mode = mode
+        self._dirty = True
+        
+        # Color attributes are fixed once curses is set up
+        self._has_colors = curses.has_colors()
+        self._attr_head = curses.A_BOLD | (curses.color_pair(3) if self._has_colors else 0)
+        self._attr_body = curses.color_pair(2) if self._has_colors else 0
+        self._attr_food = (curses.color_pair(4) | curses.A_BOLD) if self._has_colors else curses.A_BOLD
+        self._attr_special = (curses.color_pair(5) | curses.A_BOLD) if self._has_colors else curses.A_BOLD
         
         # Get screen dimensions
         height, width = self.screen.getmaxyx()
@@ -110,25 +156,35 @@ class SnakeGame(BaseGame):
         self.width = min(width - 4, 30)
         self.height = min(height - 6, 20)
         
+        # Border rows never change during a game, so build them once
+        self._top_border = '┌' + '─' * (self.width + 1) + '┐'
+        self._side_border = '│' + ' ' * (self.width + 1) + '│'
+        self._bot_border = '└' + '─' * (self.width + 1) + '┘'
+        
         # Mode-specific settings
         if mode == GameMode.NORMAL:
             self.game_speed = 150
         elif mode == GameMode.TIME_ATTACK:
             self.game_speed = 120
             self.time_limit = 180  # 3 minutes
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
         elif mode == GameMode.INFINITE:
             self.game_speed = 100
         elif mode == GameMode.SPEEDRUN:
             self.game_speed = 80  # Faster for speedrun
             self.time_limit = 120  # 2 minutes
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
+        
+        # Absolute end time for timed modes
+        self._deadline = self.start_time + self.time_limit
         
         # Initialize snake
         self._initialize_snake()
         
         # Place first food
         self._place_food()
+        
+        self._refresh_ui_lines()
     
     def _initialize_snake(self):
         """Initialize the snake in the center of the screen."""
@@ -143,82 +199,120 @@ class SnakeGame(BaseGame):
         
         self.direction = Direction.RIGHT
         self.next_direction = Direction.RIGHT
+        self._dir_idx = _DIR_IDX[Direction.RIGHT]
+        self._next_dir_idx = self._dir_idx
+        
+        # Position -> token map: 'S' snake, 'F' food, 'X' special food
+        self._occupancy = {pos: 'S' for pos in self.snake}
+        self.special_food = None
     
     def _place_food(self):
         """Place food at a random position not occupied by the snake."""
-        available_positions = []
+        chosen = self._random_free_cell()
+        
+        if chosen is not None:
+            self.food_pos = chosen
+            self._occupancy[chosen] = 'F'
+            
+            # Occasionally place special food on its own free cell
+            if random.random() < 0.1:  # 10% chance
+                special = self._random_free_cell()
+                if special is not None:
+                    self._clear_special_food()
+                    self.special_food = special
+                    self._occupancy[special] = 'X'
+                    self.special_food_expiry = time.monotonic() + 5.0  # 5 seconds
+    
+    def _random_free_cell(self):
+        """Return a uniformly chosen empty cell, or None if the board is full."""
+        occupancy = self._occupancy
+        chosen = None
+        count = 0
         
+        # Reservoir sampling: keep the k-th free cell with probability 1/k
         for x in range(self.width):
             for y in range(self.height):
-                if (x, y) not in self.snake:
-                    available_positions.append((x, y))
+                if (x, y) not in occupancy:
+                    count += 1
+                    if random.random() * count < 1.0:
+                        chosen = (x, y)
         
-        if available_positions:
-            self.food_pos = random.choice(available_positions)
-            
-            # Occasionally place special food
-            if random.random() < 0.1:  # 10% chance
-                self.special_food = self.food_pos
-                self.special_food_timer = 50  # 5 seconds at 10 FPS
+        return chosen
+    
+    def _clear_special_food(self):
+        """Remove the special food from the board if present."""
+        if self.special_food and self._occupancy.get(self.special_food) == 'X':
+            del self._occupancy[self.special_food]
+        self.special_food = None
     
     def _handle_game_input(self, screen):
         """Handle keyboard input."""
-        key = screen.getch()
-        
+        # Drain every pending key so buffered input is not applied a frame late
+        while self.running:
+            key = screen.getch()
+            if key == -1:
+                break
+            self._process_key(key)
+    
+    def _process_key(self, key):
+        """Apply a single key press."""
         if key == 27:  # ESC
             self.running = False
             return
         elif key in [ord('p'), ord('P')]:
             self.paused = not self.paused
+            self._dirty = True
             return
         
         if self.paused:
             return
         
-        # Direction changes (prevent reversing into self)
-        if key in [curses.KEY_UP, ord('w'), ord('W')] and self.direction != Direction.DOWN:
-            self.next_direction = Direction.UP
-        elif key in [curses.KEY_DOWN, ord('s'), ord('S')] and self.direction != Direction.UP:
-            self.next_direction = Direction.DOWN
-        elif key in [curses.KEY_LEFT, ord('a'), ord('A')] and self.direction != Direction.RIGHT:
-            self.next_direction = Direction.LEFT
-        elif key in [curses.KEY_RIGHT, ord('d'), ord('D')] and self.direction != Direction.LEFT:
-            self.next_direction = Direction.RIGHT
+        # Direction changes
+        dir_idx = _KEY_TO_DIR.get(key)
+        if dir_idx is not None:
+            self._turn(dir_idx)
+    
+    def _turn(self, dir_idx):
+        """Queue a direction change unless it would reverse into the snake."""
+        if _OPPOSITE_IDX[dir_idx] != self._dir_idx:
+            self._next_dir_idx = dir_idx
+            self.next_direction = _DIRECTIONS[dir_idx]
+            self._dirty = True
     
-    def _update(self):
+    def _update(self, now):
         """Update game state."""
         if self.paused or self.game_over:
             return
         
         # Check time limit for timed modes
-        if self.time_limit > 0:
-            elapsed = time.time() - self.start_time
-            if elapsed >= self.time_limit:
-                self.game_over = True
-                return
+        if self.time_limit > 0 and now >= self._deadline:
+            self.game_over = True
+            return
         
         # Update direction
         self.direction = self.next_direction
+        self._dir_idx = self._next_dir_idx
         
         # Calculate new head position
         head_x, head_y = self.snake[0]
-        dx, dy = self.direction.value
+        dx, dy = _DIR_DELTA[self._dir_idx]
         new_head = (head_x + dx, head_y + dy)
         
         # Check collisions
-        if (new_head[0] < 0 or new_head[0] >= self.width or
-            new_head[1] < 0 or new_head[1] >= self.height or
-            new_head in self.snake):
+        cell = self._occupancy.get(new_head)
+        if (not (0 <= new_head[0] < self.width and 0 <= new_head[1] < self.height)
+                or cell == 'S'):
             self.game_over = True
             return
         
         # Move snake
         self.snake.insert(0, new_head)
+        self._occupancy[new_head] = 'S'
         self.moves += 1
         
         # Check if food eaten
         food_eaten = False
-        if new_head == self.food_pos:
+        if cell == 'F':
             self.food_eaten += 1
             self.score += 10
             food_eaten = True
@@ -228,26 +322,27 @@ class SnakeGame(BaseGame):
             if self.food_eaten % 5 == 0:
                 self.level += 1
                 self.game_speed = max(50, self.game_speed - 10)  # Speed up
-        elif new_head == self.special_food:
+        elif cell == 'X':
             self.score += 50
             self.special_food = None
-            self.special_food_timer = 0
         else:
             # Remove tail if no food eaten
-            self.snake.pop()
+            tail = self.snake.pop()
+            del self._occupancy[tail]
         
-        # Update special food timer
-        if self.special_food_timer > 0:
-            self.special_food_timer -= 1
-            if self.special_food_timer <= 0:
-                self.special_food = None
+        # Expire special food
+        if self.special_food and now >= self.special_food_expiry:
+            self._clear_special_food()
         
         # Bonus for efficient movement (in speedrun mode)
         if self.current_mode == GameMode.SPEEDRUN and food_eaten:
             efficiency_bonus = max(0, 20 - len(self.snake))
             self.score += efficiency_bonus
+        
+        self._refresh_ui_lines()
+        self._dirty = True
     
-    def _render(self, screen):
+    def _render(self, screen, now):
         """Render the game."""
         screen.clear()
         height, width = screen.getmaxyx()
@@ -260,52 +355,48 @@ class SnakeGame(BaseGame):
         game_x = (width - self.width) // 2
         game_y = (height - self.height) // 2
         
-        # Draw border
-        for x in range(self.width + 2):
-            screen.addch(game_y - 1, game_x + x, '─')
-            screen.addch(game_y + self.height, game_x + x, '─')
-        
+        # Draw border (one addstr per row using the prebuilt strings)
+        screen.addstr(game_y - 1, game_x - 1, self._top_border)
         for y in range(self.height):
-            screen.addch(game_y + y, game_x - 1, '│')
-            screen.addch(game_y + y, game_x + self.width + 1, '│')
-        
-        # Draw corners
-        screen.addch(game_y - 1, game_x - 1, '┌')
-        screen.addch(game_y - 1, game_x + self.width + 1, '┐')
-        screen.addch(game_y + self.height, game_x - 1, '└')
-        screen.addch(game_y + self.height, game_x + self.width + 1, '┘')
-        
-        # Draw snake
-        for i, (x, y) in enumerate(self.snake):
-            screen_x = game_x + x
-            screen_y = game_y + y
-            
-            if i == 0:  # Head
-                char = self._get_head_char()
-                attr = curses.A_BOLD | (curses.color_pair(3) if curses.has_colors() else 0)
-            else:  # Body
-                char = '█'
-                attr = curses.color_pair(2) if curses.has_colors() else 0
-            
-            screen.addch(screen_y, screen_x, char, attr)
+            screen.addstr(game_y + y, game_x - 1, self._side_border)
+        screen.addstr(game_y + self.height, game_x - 1, self._bot_border)
+        
+        # Draw snake body as one addstr per horizontal run of segments
+        body_rows = {}
+        for x, y in self.snake[1:]:
+            body_rows.setdefault(y, []).append(x)
+        
+        for y, xs in body_rows.items():
+            xs.sort()
+            run_start = prev_x = xs[0]
+            for x in xs[1:]:
+                if x != prev_x + 1:
+                    screen.addstr(game_y + y, game_x + run_start,
+                                  '█' * (prev_x - run_start + 1), self._attr_body)
+                    run_start = x
+                prev_x = x
+            screen.addstr(game_y + y, game_x + run_start,
+                          '█' * (prev_x - run_start + 1), self._attr_body)
+        
+        # Draw snake head
+        head_x, head_y = self.snake[0]
+        screen.addch(game_y + head_y, game_x + head_x, self._get_head_char(), self._attr_head)
         
         # Draw food
         food_x, food_y = self.food_pos
-        screen.addch(game_y + food_y, game_x + food_x, '●', 
-                    curses.color_pair(4) | curses.A_BOLD if curses.has_colors() else curses.A_BOLD)
+        screen.addch(game_y + food_y, game_x + food_x, '●', self._attr_food)
         
         # Draw special food if present
         if self.special_food:
             sfx, sfy = self.special_food
-            screen.addch(game_y + sfy, game_x + sfx, '★',
-                        curses.color_pair(5) | curses.A_BOLD if curses.has_colors() else curses.A_BOLD)
+            screen.addch(game_y + sfy, game_x + sfx, '★', self._attr_special)
         
         # Draw UI
-        self._draw_ui(screen)
+        self._draw_ui(screen, now)
         
         # Draw pause overlay if paused
         if self.paused:
-            self._draw_pause_overlay(screen)
+            self._draw_pause_overlay(screen, height, width)
         
         # Draw controls hint
         controls_text = "Arrow Keys/WASD: Move | P: Pause | ESC: Quit"
@@ -315,58 +406,39 @@ class SnakeGame(BaseGame):
     
     def _get_head_char(self):
         """Get the character for the snake head based on direction."""
-        chars = {
-            Direction.UP: '▲',
-            Direction.DOWN: '▼',
-            Direction.LEFT: '◄',
-            Direction.RIGHT: '►'
-        }
-        return chars.get(self.direction, '●')
+        return _HEAD_CHAR[self._dir_idx]
     
-    def _draw_ui(self, screen):
-        """Draw UI elements."""
-        height, width = screen.getmaxyx()
-        
-        # Score and stats
-        info_lines = [
+    def _refresh_ui_lines(self):
+        """Rebuild the cached stats lines after a state change."""
+        self._ui_lines = (
             f"Score: {self.score}",
             f"Length: {len(self.snake)}",
             f"Food: {self.food_eaten}",
             f"Speed: {1000//self.game_speed} FPS"
-        ]
+        )
+        self._progress_text = f"Next Level: {self.food_eaten % 5}/5"
+    
+    def _draw_ui(self, screen, now):
+        """Draw UI elements."""
+        # Score and stats
+        for i, line in enumerate(self._ui_lines):
+            screen.addstr(2 + i, 2, line)
+        row = 2 + len(self._ui_lines)
         
         if self.time_limit > 0:
-            elapsed = time.time() - self.start_time
-            remaining = max(0, self.time_limit - elapsed)
-            info_lines.append(f"Time: {remaining:.1f}s")
-        
-        for i, line in enumerate(info_lines):
-            screen.addstr(2 + i, 2, line)
+            remaining = max(0, self._deadline - now)
+            screen.addstr(row, 2, f"Time: {remaining:.1f}s")
+            row += 1
         
         # Next level progress
-        progress = self.food_eaten % 5
-        progress_text = f"Next Level: {progress}/5"
-        screen.addstr(2 + len(info_lines), 2, progress_text)
+        screen.addstr(row, 2, self._progress_text)
     
-    def _draw_pause_overlay(self, screen):
+    def _draw_pause_overlay(self, screen, height, width):
         """Draw pause overlay."""
-        height, width = screen.getmaxyx()
-        
-        pause_text = [
-            "╔" + "═" * 20 + "╗",
-            "║" + " " * 20 + "║",
-            "║" + "     PAUSED     " + "║",
-            "║" + " " * 20 + "║",
-            "║" + "  Press P to   " + "║",
-            "║" + "   resume       " + "║",
-            "║" + " " * 20 + "║",
-            "╚" + "═" * 20 + "╝"
-        ]
-        
-        start_y = (height - len(pause_text)) // 2
+        start_y = (height - self._PAUSE_HEIGHT) // 2
         start_x = (width - 22) // 2
         
-        for i, line in enumerate(pause_text):
+        for i, line in enumerate(self._PAUSE_TEXT):
             screen.addstr(start_y + i, start_x, line, curses.A_REVERSE)
     
     def get_controls_help(self) -> str:
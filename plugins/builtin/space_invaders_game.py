@@ -12,6 +12,36 @@ from enum import Enum
 
 from plugins.base_game import BaseGame, GameMode
 
+# Preallocated object pool sizes (pools grow on demand if exhausted)
+_BULLET_POOL_SIZE = 256
+_PARTICLE_POOL_SIZE = 512
+
+# Spatial hash cell size for bullet/invader collision checks
+_COLLISION_CELL = 2
+
+# Glyph tables
+_BULLET_PLAYER_CHAR = '|'
+_BULLET_ENEMY_CHAR = '↓'
+_STAR_CHARS = ('·', '+', '✦')
+_EXPLOSION_CHARS = ('*', '+', '·')
+_DAMAGE_CHARS = ('!', '💥', '⚡')
+_CELEBRATION_CHARS = ('★', '✦', '✧')
+
+# Glyphs that occupy two terminal columns
+_WIDE_CHARS = frozenset('👾👽🛸💥⚡')
+
+# Pause overlay box
+_PAUSE_LINES = (
+    '╔════════════════════╗',
+    '║                    ║',
+    '║       PAUSED       ║',
+    '║                    ║',
+    '║     Press P to     ║',
+    '║       resume       ║',
+    '║                    ║',
+    '╚════════════════════╝'
+)
+
 class InvaderType(Enum):
     """Types of alien invaders."""
     BASIC = "basic"      # Worth 10 points
@@ -22,27 +52,35 @@ class Direction(Enum):
     LEFT = -1
     RIGHT = 1
 
+# Alternate animation frame character per invader type
+_ALT_CHARS = {
+    InvaderType.BASIC: '👾',
+    InvaderType.MEDIUM: '👽',
+    InvaderType.ELITE: '🛸'
+}
+
 class Bullet:
     """Represents a bullet."""
     
+    __slots__ = ('x', 'y', 'dy', 'is_player', 'active')
+    
     def __init__(self, x: float, y: float, dy: float, is_player: bool = True):
+        self.reset(x, y, dy, is_player)
+    
+    def reset(self, x: float, y: float, dy: float, is_player: bool = True):
+        """Reinitialize a pooled bullet."""
         self.x = x
         self.y = y
         self.dy = dy
         self.is_player = is_player
         self.active = True
-    
-    def update(self, dt: float):
-        """Update bullet position."""
-        self.y += self.dy * dt * 10
-        
-        # Deactivate if out of bounds
-        if self.y < 0 or self.y > 30:
-            self.active = False
 
 class Invader:
     """Represents an alien invader."""
     
+    __slots__ = ('x', 'y', 'type', 'animation_frame', 'animation_timer',
+                 'shoot_cooldown', 'char', 'current_char', 'points', 'health')
+    
     def __init__(self, x: float, y: float, invader_type: InvaderType):
         self.x = x
         self.y = y
@@ -64,38 +102,31 @@ class Invader:
             self.char = '🛸'
             self.points = 30
             self.health = 3
+        
+        self.current_char = self.char
     
-    def update(self, dt: float, shoot_chance: float):
-        """Update invader."""
+    def update(self, dt: float) -> bool:
+        """Update invader. Returns True if it is ready to fire."""
         # Update animation
         self.animation_timer += dt
         if self.animation_timer > 0.5:
             self.animation_timer = 0
             self.animation_frame = (self.animation_frame + 1) % 2
+            self.current_char = self.char if self.animation_frame == 0 else _ALT_CHARS[self.type]
         
         # Update shoot cooldown
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= dt
         
-        # Randomly shoot
-        if self.shoot_cooldown <= 0 and random.random() < shoot_chance:
-            self.shoot_cooldown = 2.0  # 2 second cooldown
-            return Bullet(self.x, self.y + 1, 1, is_player=False)
-        
-        return None
+        return self.shoot_cooldown <= 0
+    
+    def fire(self):
+        """Start the cooldown after shooting."""
+        self.shoot_cooldown = 2.0  # 2 second cooldown
     
     def get_display_char(self) -> str:
         """Get current display character."""
-        if self.animation_frame == 0:
-            return self.char
-        else:
-            # Alternate character for animation
-            if self.type == InvaderType.BASIC:
-                return '👾'
-            elif self.type == InvaderType.MEDIUM:
-                return '👽'
-            else:
-                return '🛸'
+        return self.current_char
 
 class PlayerShip:
     """Represents the player's ship."""
@@ -124,18 +155,26 @@ class PlayerShip:
         """Check if player can shoot."""
         return self.shoot_cooldown <= 0
     
-    def shoot(self) -> Bullet:
-        """Shoot a bullet."""
+    def shoot(self) -> bool:
+        """Shoot a bullet. Returns True if the ship fired."""
         if self.can_shoot():
             self.shoot_cooldown = 0.3  # Rapid fire
-            return Bullet(self.x, self.y - 1, -1, is_player=True)
-        return None
+            return True
+        return False
 
 class Particle:
     """Represents a visual effect."""
     
+    __slots__ = ('x', 'y', 'dx', 'dy', 'char', 'lifetime', 'max_lifetime', 'color',
+                 'has_gravity')
+    
     def __init__(self, x: float, y: float, dx: float, dy: float, 
                  char: str, lifetime: float, color: Optional[int] = None):
+        self.reset(x, y, dx, dy, char, lifetime, color)
+    
+    def reset(self, x: float, y: float, dx: float, dy: float,
+              char: str, lifetime: float, color: Optional[int] = None):
+        """Reinitialize a pooled particle."""
         self.x = x
         self.y = y
         self.dx = dx
@@ -144,18 +183,7 @@ class Particle:
         self.lifetime = lifetime
         self.max_lifetime = lifetime
         self.color = color
-    
-    def update(self, dt: float) -> bool:
-        """Update particle. Returns False if expired."""
-        self.x += self.dx * dt
-        self.y += self.dy * dt
-        self.lifetime -= dt
-        
-        # Apply gravity to some particles
-        if self.char in ['*', '·']:
-            self.dy += 50 * dt
-        
-        return self.lifetime > 0
+        self.has_gravity = char in ('*', '·')  # Debris falls, sparks float
 
 class SpaceInvadersGame(BaseGame):
     """Classic Space Invaders game implementation."""
@@ -195,6 +223,11 @@ class SpaceInvadersGame(BaseGame):
         self.particles: List[Particle] = []
         self.barriers: List[List[bool]] = []  # Barrier protection
         
+        # Freelists of inactive objects reused by _spawn_bullet/_spawn_particle
+        self._bullet_free: List[Bullet] = [Bullet(0, 0, 0) for _ in range(_BULLET_POOL_SIZE)]
+        self._particle_free: List[Particle] = [Particle(0, 0, 0, 0, ' ', 0)
+                                               for _ in range(_PARTICLE_POOL_SIZE)]
+        
         # Game state
         self.wave = 1
         self.invader_direction = Direction.RIGHT
@@ -211,6 +244,17 @@ class SpaceInvadersGame(BaseGame):
         self.last_update = 0
         self.game_start_time = 0
         
+        # Incremental rendering state
+        self._dirty = True
+        self._full_redraw = True
+        self._screen_size = None
+        self._prev_rows = []
+        self._ui_line_lens = {}
+        self._prev_ui_state = None
+        self._ui_lines = ()
+        self._title = ""
+        self._wave_bonus = 0
+        
     def run(self, screen, mode=GameMode.NORMAL, **kwargs):
         """Main game loop."""
         self.screen = screen
@@ -233,13 +277,16 @@ class SpaceInvadersGame(BaseGame):
             
             # Update game state
             if not self.paused:
-                self._update(dt)
+                self._update(dt, current_time)
             
-            # Render
-            self._render(screen)
+            # Render; a paused scene only changes on input
+            if self._dirty or not self.paused:
+                self._render(screen, current_time)
+                self._dirty = False
             
-            # Small delay
-            time.sleep(0.016)  # ~60 FPS
+            # Sleep off whatever is left of the ~60 FPS frame budget
+            elapsed = time.time() - current_time
+            time.sleep(max(0, 0.01667 - elapsed))
         
         self.cleanup_screen(screen)
         return self.score
@@ -254,7 +301,14 @@ class SpaceInvadersGame(BaseGame):
         self.current_mode = mode
         self.game_start_time = time.time()
         
+        # Color attributes are fixed once curses is set up
+        self._has_colors = curses.has_colors()
+        self._player_attr = (curses.color_pair(3) | curses.A_BOLD) if self._has_colors else curses.A_BOLD
+        self._player_bullet_attr = curses.color_pair(4) if self._has_colors else 0
+        self._enemy_bullet_attr = curses.color_pair(5) if self._has_colors else 0
+        
         # Mode-specific settings
+        self.wave_bonus_multiplier = 1.0
         if mode == GameMode.TIME_ATTACK:
             self.time_limit = 300  # 5 minutes
             self.start_time = time.time()
@@ -262,20 +316,33 @@ class SpaceInvadersGame(BaseGame):
             self.wave_bonus_multiplier = 2.0  # Double points for waves
             self.time_limit = 240  # 4 minutes
             self.start_time = time.time()
-        else:
-            self.wave_bonus_multiplier = 1.0
         
         # Create player ship
         self.player_ship = PlayerShip(self.width // 2, self.height - 3)
         
-        # Initialize game objects
+        # Initialize game objects (returning live objects to the pools)
         self.invaders.clear()
+        self._bullet_free.extend(self.bullets)
         self.bullets.clear()
+        self._particle_free.extend(self.particles)
         self.particles.clear()
         
         # Create barriers
         self._create_barriers()
         
+        # Fixed star field background (30% star density)
+        self._bg_rows = [[' '] * self.width for _ in range(self.height)]
+        for i in range(20):
+            if random.random() < 0.3:
+                self._bg_rows[(i * 3) % self.height][(i * 7) % self.width] = random.choice(_STAR_CHARS)
+        
+        # Per-frame row buffer and the static border rows
+        self._rowbuf = [[' '] * self.width for _ in range(self.height)]
+        self._border_top = '┌' + '─' * self.width + '┐'
+        self._border_bottom = '└' + '─' * self.width + '┘'
+        self._full_redraw = True
+        self._dirty = True
+        
         # Spawn first wave
         self._spawn_wave(self.wave)
     
@@ -322,6 +389,20 @@ class SpaceInvadersGame(BaseGame):
         
         self.wave_clear = False
         self.wave_clear_timer = 0
+        self._title = f"SPACE INVADERS - Wave {wave_number}"
+        
+        # Each ready invader fires with this per-frame probability
+        shoot_chance = 0.001 + (wave_number - 1) * 0.0002  # Increase shooting with waves
+        self._log_no_shot = math.log(1.0 - shoot_chance)
+        self._shot_skip = self._next_shot_skip()
+    
+    def _next_shot_skip(self) -> int:
+        """Draw how many ready-invader rolls fail before the next shot.
+        
+        Sampling the geometric gap between shots costs one random() per shot
+        instead of one per ready invader per frame, with the same odds.
+        """
+        return int(math.log(1.0 - random.random()) / self._log_no_shot)
     
     def _handle_game_input(self, screen):
         """Handle keyboard input."""
@@ -332,6 +413,8 @@ class SpaceInvadersGame(BaseGame):
             return
         elif key in [ord('p'), ord('P')]:
             self.paused = not self.paused
+            self._full_redraw = True  # Repaint over the pause overlay
+            self._dirty = True
             return
         
         if self.paused or self.game_over or not self.player_ship:
@@ -340,18 +423,20 @@ class SpaceInvadersGame(BaseGame):
         # Player controls
         if key in [curses.KEY_LEFT, ord('a'), ord('A')]:
             self.player_ship.move_left(0.1, self.width)
+            self._dirty = True
         elif key in [curses.KEY_RIGHT, ord('d'), ord('D')]:
             self.player_ship.move_right(0.1, self.width)
+            self._dirty = True
         elif key in [ord(' '), curses.KEY_ENTER]:  # Space or Enter to shoot
-            bullet = self.player_ship.shoot()
-            if bullet:
-                self.bullets.append(bullet)
+            if self.player_ship.shoot():
+                self._spawn_bullet(self.player_ship.x, self.player_ship.y - 1, -1, True)
+                self._dirty = True
     
-    def _update(self, dt: float):
+    def _update(self, dt: float, now: float):
         """Update game state."""
         # Check time limit for timed modes
         if hasattr(self, 'time_limit') and self.time_limit > 0:
-            elapsed = time.time() - self.start_time
+            elapsed = now - self.start_time
             if elapsed >= self.time_limit:
                 self.game_over = True
                 return
@@ -361,27 +446,56 @@ class SpaceInvadersGame(BaseGame):
             self.player_ship.update(dt)
         
         # Update invaders
-        new_bullets = []
-        shoot_chance = 0.001 + (self.wave - 1) * 0.0002  # Increase shooting with waves
-        
         for invader in self.invaders:
-            bullet = invader.update(dt, shoot_chance)
-            if bullet:
-                new_bullets.append(bullet)
-        
-        self.bullets.extend(new_bullets)
+            if invader.update(dt):
+                if self._shot_skip > 0:
+                    self._shot_skip -= 1
+                else:
+                    invader.fire()
+                    self._spawn_bullet(invader.x, invader.y + 1, 1, False)
+                    self._shot_skip = self._next_shot_skip()
         
         # Move invaders
         self._move_invaders(dt)
         
-        # Update bullets
-        self.bullets = [bullet for bullet in self.bullets if bullet.active]
-        for bullet in self.bullets:
-            bullet.update(dt)
-        
-        # Update particles
-        self.particles = [particle for particle in self.particles 
-                        if particle.update(dt)]
+        # Bullet and particle movement lives only in these two loops (the classes
+        # have no update methods), using locals as they run for every live object
+        # every frame.
+        # Update bullets, swap-and-popping spent ones back to the pool in place
+        bullets = self.bullets
+        bullet_step = dt * 10
+        i = 0
+        while i < len(bullets):
+            bullet = bullets[i]
+            if bullet.active:
+                by = bullet.y + bullet.dy * bullet_step
+                bullet.y = by
+                if by < 0 or by > 30:
+                    bullet.active = False
+                i += 1
+            else:
+                bullets[i] = bullets[-1]
+                bullets.pop()
+                self._bullet_free.append(bullet)
+        
+        # Update particles, swap-and-popping expired ones back to the pool
+        particles = self.particles
+        gravity_step = 50 * dt
+        i = 0
+        while i < len(particles):
+            particle = particles[i]
+            particle.x += particle.dx * dt
+            particle.y += particle.dy * dt
+            particle.lifetime -= dt
+            if particle.has_gravity:
+                particle.dy += gravity_step
+            
+            if particle.lifetime > 0:
+                i += 1
+            else:
+                particles[i] = particles[-1]
+                particles.pop()
+                self._particle_free.append(particle)
         
         # Check collisions
         self._check_collisions()
@@ -392,17 +506,15 @@ class SpaceInvadersGame(BaseGame):
             self.wave_clear_timer = 2.0  # 2 second celebration
             
             # Wave completion bonus
-            wave_bonus = 1000 * self.wave * self.wave_bonus_multiplier
-            self.score += int(wave_bonus)
+            self._wave_bonus = int(1000 * self.wave * self.wave_bonus_multiplier)
+            self.score += self._wave_bonus
             
             # Create celebration effect
-            for _ in range(20):
+            for char in random.choices(_CELEBRATION_CHARS, k=20):
                 x = random.uniform(5, self.width - 5)
                 y = random.uniform(5, self.height // 2)
-                self.particles.append(
-                    Particle(x, y, random.uniform(-2, 2), random.uniform(-3, -1),
-                           random.choice(['★', '✦', '✧']), 1.5)
-                )
+                self._spawn_particle(x, y, random.uniform(-2, 2), random.uniform(-3, -1),
+                                     char, 1.5)
         
         # Handle wave clear timer
         if self.wave_clear and self.wave_clear_timer > 0:
@@ -410,84 +522,148 @@ class SpaceInvadersGame(BaseGame):
             if self.wave_clear_timer <= 0:
                 self.wave += 1
                 self._spawn_wave(self.wave)
+                self._full_redraw = True  # Clear the celebration text
+        
+        # Something is always in motion while the game runs
+        self._dirty = True
+    
+    def _spawn_bullet(self, x: float, y: float, dy: float, is_player: bool) -> Bullet:
+        """Activate a bullet from the pool, allocating only if it is empty."""
+        if self._bullet_free:
+            bullet = self._bullet_free.pop()
+            bullet.reset(x, y, dy, is_player)
+        else:
+            bullet = Bullet(x, y, dy, is_player)
+        self.bullets.append(bullet)
+        return bullet
+    
+    def _spawn_particle(self, x: float, y: float, dx: float, dy: float,
+                        char: str, lifetime: float) -> Particle:
+        """Activate a particle from the pool, allocating only if it is empty."""
+        if self._particle_free:
+            particle = self._particle_free.pop()
+            particle.reset(x, y, dx, dy, char, lifetime)
+        else:
+            particle = Particle(x, y, dx, dy, char, lifetime)
+        self.particles.append(particle)
+        return particle
     
     def _move_invaders(self, dt: float):
         """Move invaders in formation."""
         if not self.invaders:
             return
         
-        # Move horizontally
+        # Move horizontally, tracking the formation's extent in the same pass
         move_speed = 0.05 + (self.wave - 1) * 0.01
+        step = self.invader_direction.value * move_speed
+        min_x = max_x = self.invaders[0].x + step
         
         for invader in self.invaders:
-            invader.x += self.invader_direction.value * move_speed
-        
-        # Check if need to change direction
-        should_drop = False
-        for invader in self.invaders:
-            if invader.x <= 2 or invader.x >= self.width - 3:
-                should_drop = True
-                break
-        
-        if should_drop:
-            # Change direction
+            x = invader.x + step
+            invader.x = x
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+        
+        # Change direction and drop when the formation touches an edge
+        if min_x <= 2 or max_x >= self.width - 3:
             self.invader_direction = Direction.RIGHT if self.invader_direction == Direction.LEFT else Direction.LEFT
             
-            # Drop down
+            max_y = self.invaders[0].y + 1
             for invader in self.invaders:
                 invader.y += 1
+                if invader.y > max_y:
+                    max_y = invader.y
             
             # Check if invaders reached player
-            for invader in self.invaders:
-                if invader.y >= self.height - 5:
-                    self._end_game()
-                    return
+            if max_y >= self.height - 5:
+                self._end_game()
     
     def _check_collisions(self):
         """Check all collisions."""
-        # Bullet-invader collisions
-        for bullet in self.bullets[:]:
-            if bullet.is_player:  # Player bullets
-                for invader in self.invaders[:]:
-                    if (abs(bullet.x - invader.x) < 1 and 
-                        abs(bullet.y - invader.y) < 1):
+        # Split bullets by owner once instead of re-testing is_player per pass
+        player_bullets = []
+        enemy_bullets = []
+        for bullet in self.bullets:
+            if bullet.is_player:
+                player_bullets.append(bullet)
+            else:
+                enemy_bullets.append(bullet)
+        
+        # Bullet-invader collisions via a spatial hash of the wave, so each
+        # bullet only tests invaders in the cells its hitbox can overlap
+        cell = _COLLISION_CELL
+        buckets = {}
+        destroyed = False
+        if player_bullets:
+            for invader in self.invaders:
+                key = (int(invader.x // cell), int(invader.y // cell))
+                bucket = buckets.get(key)
+                if bucket is None:
+                    buckets[key] = [invader]
+                else:
+                    bucket.append(invader)
+        
+        for bullet in player_bullets:
+            bx, by = bullet.x, bullet.y
+            for cx in range(int((bx - 1) // cell), int((bx + 1) // cell) + 1):
+                for cy in range(int((by - 1) // cell), int((by + 1) // cell) + 1):
+                    for invader in buckets.get((cx, cy), ()):
+                        # Destroyed invaders stay bucketed with health <= 0
+                        if (invader.health <= 0 or abs(bx - invader.x) >= 1 or
+                                abs(by - invader.y) >= 1):
+                            continue
+                        
                         # Hit invader
                         invader.health -= 1
                         bullet.active = False
                         
                         if invader.health <= 0:
-                            # Destroy invader
-                            self.invaders.remove(invader)
+                            # Destroy invader (removed from the list below)
+                            destroyed = True
                             self.score += invader.points
                             
                             # Create explosion effect
-                            for _ in range(8):
-                                self.particles.append(
-                                    Particle(invader.x, invader.y,
-                                           random.uniform(-3, 3), random.uniform(-3, 3),
-                                           random.choice(['*', '+', '·']), 0.8)
-                                )
+                            for char in random.choices(_EXPLOSION_CHARS, k=8):
+                                self._spawn_particle(invader.x, invader.y,
+                                                     random.uniform(-3, 3), random.uniform(-3, 3),
+                                                     char, 0.8)
+                        
+                        # A bullet is spent after its first hit
+                        break
+                    if not bullet.active:
+                        break
+                if not bullet.active:
+                    break
+        
+        # Drop destroyed invaders with swap-and-pop; order is not significant
+        if destroyed:
+            invaders = self.invaders
+            for i in range(len(invaders) - 1, -1, -1):
+                if invaders[i].health <= 0:
+                    invaders[i] = invaders[-1]
+                    invaders.pop()
         
         # Bullet-player collisions
-        for bullet in self.bullets[:]:
-            if not bullet.is_player:  # Enemy bullets
-                if (self.player_ship and 
-                    abs(bullet.x - self.player_ship.x) < 1 and 
-                    abs(bullet.y - self.player_ship.y) < 1):
-                    # Hit player
-                    self.lives -= 1
-                    bullet.active = False
-                    
-                    # Create damage effect
-                    for _ in range(6):
-                        self.particles.append(
-                            Particle(self.player_ship.x, self.player_ship.y,
-                                   random.uniform(-2, 2), random.uniform(-2, 2),
-                                   random.choice(['!', '💥', '⚡']), 0.6)
-                        )
-                    
-                    if self.lives <= 0:
-                        self._end_game()
+        if not self.player_ship:
+            return
+        px, py = self.player_ship.x, self.player_ship.y
+        for bullet in enemy_bullets:
+            if abs(bullet.x - px) < 1 and abs(bullet.y - py) < 1:
+                # Hit player
+                self.lives -= 1
+                bullet.active = False
+                
+                # Create damage effect
+                for char in random.choices(_DAMAGE_CHARS, k=6):
+                    self._spawn_particle(px, py,
+                                         random.uniform(-2, 2), random.uniform(-2, 2),
+                                         char, 0.6)
+                
+                if self.lives <= 0:
+                    self._end_game()
+                    break
     
     def _end_game(self):
         """End the game."""
@@ -504,140 +680,199 @@ class SpaceInvadersGame(BaseGame):
         
         self.score = final_score
     
-    def _render(self, screen):
+    def _render(self, screen, now: float):
         """Render the game."""
-        screen.clear()
         height, width = screen.getmaxyx()
         
-        # Draw title
-        title = f"SPACE INVADERS - Wave {self.wave}"
-        screen.addstr(0, (width - len(title)) // 2, title, curses.A_BOLD)
-        
         # Calculate game area position (centered)
         game_x = (width - self.width) // 2
         game_y = (height - self.height) // 2 + 1
         
-        # Draw game area
-        self._draw_game_area(screen, game_x, game_y)
+        # A stats line that got shorter would leave the end of its old text
+        # behind, over cells that belong to the layers drawn underneath it
+        info_lines = self._info_lines(now)
+        line_lens = self._ui_line_lens
+        ui_shrank = any(len(line) < line_lens.get(i, 0) for i, line in enumerate(info_lines))
+        
+        # Static layers are only repainted on the first frame, on resize, after
+        # overlays and when the stats shrink; otherwise curses diffs just the
+        # cells that changed
+        if self._full_redraw or ui_shrank or self._screen_size != (height, width):
+            screen.erase()
+            self._screen_size = (height, width)
+            self._prev_rows = [None] * self.height
+            self._ui_line_lens = {}
+            self._full_redraw = False
+            
+            # Draw game area
+            self._draw_game_area(screen, game_x, game_y)
+            
+            # Draw controls hint
+            controls_text = "Arrow Keys/A/D: Move | Space: Shoot | P: Pause | ESC: Quit"
+            screen.addstr(height - 1, (width - len(controls_text)) // 2, controls_text)
+        
+        # Draw title
+        title = self._title
+        screen.addstr(0, (width - len(title)) // 2, title, curses.A_BOLD)
         
         # Draw game objects
         self._draw_game_objects(screen, game_x, game_y)
         
         # Draw UI
-        self._draw_ui(screen, game_x, 2)
+        self._draw_ui(screen, game_x, 2, info_lines)
         
         # Draw pause overlay if paused
         if self.paused:
             self._draw_pause_overlay(screen)
         
-        # Draw controls hint
-        controls_text = "Arrow Keys/A/D: Move | Space: Shoot | P: Pause | ESC: Quit"
-        screen.addstr(height - 1, (width - len(controls_text)) // 2, controls_text)
-        
         screen.refresh()
     
     def _draw_game_area(self, screen, x: int, y: int):
         """Draw the game area border."""
-        # Draw borders
-        for i in range(self.width):
-            screen.addch(y - 1, x + i, '─')
-            screen.addch(y + self.height, x + i, '─')
-        
+        screen.addstr(y - 1, x - 1, self._border_top)
         for i in range(self.height):
             screen.addch(y + i, x - 1, '│')
             screen.addch(y + i, x + self.width, '│')
-        
-        # Draw corners
-        screen.addch(y - 1, x - 1, '┌')
-        screen.addch(y - 1, x + self.width, '┐')
-        screen.addch(y + self.height, x - 1, '└')
-        screen.addch(y + self.height, x + self.width, '┘')
-        
-        # Draw star field background
-        for i in range(20):
-            star_x = (i * 7) % self.width
-            star_y = (i * 3) % self.height
-            if random.random() < 0.3:  # 30% star density
-                screen.addch(y + star_y, x + star_x, random.choice(['·', '+', '✦']))
+        screen.addstr(y + self.height, x - 1, self._border_bottom)
     
     def _draw_game_objects(self, screen, x: int, y: int):
-        """Draw all game objects."""
-        # Draw invaders
+        """Draw all game objects, composing each row and writing changed rows once."""
+        width, height = self.width, self.height
+        rows = self._rowbuf
+        for row, background in zip(rows, self._bg_rows):
+            row[:] = background
+        
+        wide_rows = set()
+        colored = {}  # (row, col) -> (char, attr) drawn on top of the rows
+        
+        # Invaders
         for invader in self.invaders:
-            if 0 <= invader.x < self.width and 0 <= invader.y < self.height:
-                char = invader.get_display_char()
-                screen.addch(y + int(invader.y), x + int(invader.x), char)
+            if 0 <= invader.x < width and 0 <= invader.y < height:
+                r = int(invader.y)
+                rows[r][int(invader.x)] = invader.current_char
+                wide_rows.add(r)
         
-        # Draw player ship
-        if self.player_ship and 0 <= self.player_ship.x < self.width:
+        # Player ship
+        if self.player_ship and 0 <= self.player_ship.x < width:
             ship_char = '▲' if self.player_ship.health > 1 else '△'
-            screen.addch(y + int(self.player_ship.y), x + int(self.player_ship.x),
-                       ship_char, curses.color_pair(3) | curses.A_BOLD if curses.has_colors() else curses.A_BOLD)
+            r, c = int(self.player_ship.y), int(self.player_ship.x)
+            rows[r][c] = ship_char
+            colored[(r, c)] = (ship_char, self._player_attr)
         
-        # Draw bullets
+        # Bullets
         for bullet in self.bullets:
-            if 0 <= bullet.x < self.width and 0 <= bullet.y < self.height:
+            if 0 <= bullet.x < width and 0 <= bullet.y < height:
                 if bullet.is_player:
-                    char = '|'
-                    attr = curses.color_pair(4) if curses.has_colors() else 0
+                    char = _BULLET_PLAYER_CHAR
+                    attr = self._player_bullet_attr
                 else:
-                    char = '↓'
-                    attr = curses.color_pair(5) if curses.has_colors() else 0
+                    char = _BULLET_ENEMY_CHAR
+                    attr = self._enemy_bullet_attr
                 
-                screen.addch(y + int(bullet.y), x + int(bullet.x), char, attr)
+                r, c = int(bullet.y), int(bullet.x)
+                rows[r][c] = char
+                colored[(r, c)] = (char, attr)
         
-        # Draw particles
+        # Particles (faded ones, past half their lifetime, are culled first)
         for particle in self.particles:
-            if 0 <= particle.x < self.width and 0 <= particle.y < self.height:
-                opacity = particle.lifetime / particle.max_lifetime
-                if opacity > 0.5:
-                    screen.addch(y + int(particle.y), x + int(particle.x), particle.char)
+            if (2 * particle.lifetime > particle.max_lifetime and
+                    0 <= particle.x < width and 0 <= particle.y < height):
+                r, c = int(particle.y), int(particle.x)
+                rows[r][c] = particle.char
+                colored.pop((r, c), None)
+                if particle.char in _WIDE_CHARS:
+                    wide_rows.add(r)
+        
+        row_cells = {}
+        for (r, c), (char, attr) in colored.items():
+            row_cells.setdefault(r, []).append((c, char, attr))
+        
+        # A row is rewritten when its text or its colored cells change, so a
+        # colored cell that moves away can't leave a stale character behind
+        prev_rows = self._prev_rows
+        for r in range(height):
+            if r in wide_rows:
+                line, hidden = self._join_wide_row(rows[r])
+            else:
+                line, hidden = ''.join(rows[r]), ()
+            
+            cells = row_cells.get(r)
+            if cells:
+                # Cells under the right half of a wide glyph would split it
+                cells = tuple(sorted(cell for cell in cells if cell[0] not in hidden))
+            key = (line, cells) if cells else line
+            
+            if prev_rows[r] != key:
+                screen.addstr(y + r, x, line)
+                if cells:
+                    for c, char, attr in cells:
+                        screen.addch(y + r, x + c, char, attr)
+                prev_rows[r] = key
     
-    def _draw_ui(self, screen, x: int, y: int):
-        """Draw UI elements."""
-        # Score and stats
-        info_lines = [
-            f"Score: {self.score}",
-            f"Wave: {self.wave}",
-            f"Lives: {'♥' * self.lives}",
-            f"Invaders: {len(self.invaders)}"
-        ]
+    @staticmethod
+    def _join_wide_row(row: List[str]) -> Tuple[str, Tuple[int, ...]]:
+        """Join a row, dropping the cell covered by each double-width glyph.
+        
+        Returns the text and the columns that were dropped.
+        """
+        out = []
+        hidden = []
+        skip = False
+        last = len(row) - 1
+        for col, char in enumerate(row):
+            if skip:
+                skip = False
+                hidden.append(col)
+                continue
+            if char in _WIDE_CHARS:
+                if col == last:
+                    char = ' '  # No room for the second column
+                else:
+                    skip = True
+            out.append(char)
+        return ''.join(out), tuple(hidden)
+    
+    def _info_lines(self, now: float) -> Tuple[str, ...]:
+        """Return the stats lines shown beside the game area."""
+        # Score and stats, rebuilt only when one of the values changes
+        ui_state = (self.score, self.wave, self.lives, len(self.invaders))
+        if ui_state != self._prev_ui_state:
+            self._prev_ui_state = ui_state
+            self._ui_lines = (
+                f"Score: {self.score}",
+                f"Wave: {self.wave}",
+                f"Lives: {'♥' * self.lives}",
+                f"Invaders: {len(self.invaders)}"
+            )
+        info_lines = self._ui_lines
         
         if hasattr(self, 'time_limit') and self.time_limit > 0:
-            elapsed = time.time() - self.start_time
+            elapsed = now - self.start_time
             remaining = max(0, self.time_limit - elapsed)
-            info_lines.append(f"Time: {remaining:.1f}s")
-        
+            info_lines += (f"Time: {remaining:.1f}s",)
+        return info_lines
+    
+    def _draw_ui(self, screen, x: int, y: int, info_lines: Tuple[str, ...]):
+        """Draw UI elements."""
+        # Lines never get shorter here; _render repaints everything when they do
+        line_lens = self._ui_line_lens
         for i, line in enumerate(info_lines):
             screen.addstr(y + i, x, line)
+            line_lens[i] = len(line)
         
         # Wave clear celebration
         if self.wave_clear and self.wave_clear_timer > 0:
-            wave_text = "WAVE COMPLETE!"
-            bonus = int(1000 * self.wave * self.wave_bonus_multiplier)
-            bonus_text = f"Bonus: +{bonus}"
-            screen.addstr(y + 10, x + 5, wave_text, curses.A_BLINK)
-            screen.addstr(y + 11, x + 5, bonus_text, curses.A_BOLD)
+            screen.addstr(y + 10, x + 5, "WAVE COMPLETE!", curses.A_BLINK)
+            screen.addstr(y + 11, x + 5, f"Bonus: +{self._wave_bonus}", curses.A_BOLD)
     
     def _draw_pause_overlay(self, screen):
         """Draw pause overlay."""
         height, width = screen.getmaxyx()
         
-        pause_text = [
-            "╔" + "═" * 20 + "╗",
-            "║" + " " * 20 + "║",
-            "║" + "     PAUSED     " + "║",
-            "║" + " " * 20 + "║",
-            "║" + "  Press P to   " + "║",
-            "║" + "   resume       " + "║",
-            "║" + " " * 20 + "║",
-            "╚" + "═" * 20 + "╝"
-        ]
-        
-        start_y = (height - len(pause_text)) // 2
+        start_y = (height - len(_PAUSE_LINES)) // 2
         start_x = (width - 22) // 2
         
-        for i, line in enumerate(pause_text):
+        for i, line in enumerate(_PAUSE_LINES):
             screen.addstr(start_y + i, start_x, line, curses.A_REVERSE)
     
     def get_controls_help(self) -> str:
@@ -6,7 +6,7 @@ Stack falling blocks and clear lines to score points.
 import random
 import curses
 import time
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from enum import Enum
 
 from plugins.base_game import BaseGame, GameMode
@@ -21,39 +21,94 @@ class TetrominoType(Enum):
     J = ((1, 0, 0), (1, 1, 1))  # J-shape
     L = ((0, 0, 1), (1, 1, 1))  # L-shape
 
+# Packed form of each piece: (width, row bitmasks) with bit x = column x
+SHAPES: Dict[TetrominoType, Tuple[int, Tuple[int, ...]]] = {
+    tetromino_type: (
+        len(tetromino_type.value[0]),
+        tuple(sum(cell << x for x, cell in enumerate(row)) for row in tetromino_type.value),
+    )
+    for tetromino_type in TetrominoType
+}
+
+def _rotate_cw(width: int, rows: Tuple[int, ...]) -> Tuple[int, Tuple[int, ...]]:
+    """Rotate a packed shape 90 degrees clockwise."""
+    height = len(rows)
+    rotated = []
+    
+    # Column x of the old shape, read bottom to top, becomes row x of the new one
+    for x in range(width):
+        mask = 0
+        for y in range(height):
+            mask |= ((rows[height - 1 - y] >> x) & 1) << y
+        rotated.append(mask)
+    
+    return height, tuple(rotated)
+
+def _generate_rotations(width: int, rows: Tuple[int, ...]) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+    """Generate the four clockwise rotations of a packed shape."""
+    rotations = [(width, rows)]
+    for _ in range(3):
+        width, rows = _rotate_cw(width, rows)
+        rotations.append((width, rows))
+    return tuple(rotations)
+
+_PACKED_ROTATIONS: Dict[TetrominoType, Tuple[Tuple[int, Tuple[int, ...]], ...]] = {
+    tetromino_type: _generate_rotations(*shape) for tetromino_type, shape in SHAPES.items()
+}
+
+# Row bitmasks for each piece rotation, used by the bitboard collision checks
+PIECE_ROTATIONS: Dict[TetrominoType, List[List[int]]] = {
+    tetromino_type: [list(rows) for _, rows in rotations]
+    for tetromino_type, rotations in _PACKED_ROTATIONS.items()
+}
+
+# Bounding-box width of each (piece type, rotation), for single-compare wall checks
+_PIECE_WIDTHS: Dict[Tuple[TetrominoType, int], int] = {
+    (tetromino_type, rotation): width
+    for tetromino_type, rotations in _PACKED_ROTATIONS.items()
+    for rotation, (width, _) in enumerate(rotations)
+}
+
+# All rotations of every piece as cell tuples, generated once at import
+_ROTATIONS: Dict[TetrominoType, Tuple[Tuple[Tuple[int, ...], ...], ...]] = {
+    tetromino_type: tuple(
+        tuple(tuple((mask >> x) & 1 for x in range(width)) for mask in rows)
+        for width, rows in rotations
+    )
+    for tetromino_type, rotations in _PACKED_ROTATIONS.items()
+}
+
+# (column, lowest filled row) pairs for each (piece type, rotation), used for analytic drops
+_LOWEST_CELLS: Dict[Tuple[TetrominoType, int], Tuple[Tuple[int, int], ...]] = {
+    (tetromino_type, rotation): tuple(
+        (c, max(r for r, mask in enumerate(rows) if mask >> c & 1))
+        for c in range(width)
+        if any(mask >> c & 1 for mask in rows)
+    )
+    for tetromino_type, rotations in _PACKED_ROTATIONS.items()
+    for rotation, (width, rows) in enumerate(rotations)
+}
+
+# Base score for clearing 0, 1, 2, 3 and 4 lines at once
+_LINE_SCORES = (0, 100, 300, 500, 800)
+
 class Tetromino:
     """Represents a single Tetris piece."""
     
+    __slots__ = ('type', 'x', 'y', 'rotation', '_rotations', '_cached_rot', '_cached_offsets')
+    
     def __init__(self, tetromino_type: TetrominoType, x: int, y: int):
         self.type = tetromino_type
         self.x = x
         self.y = y
-        self.shape = tetromino_type.value
         self.rotation = 0
+        self._rotations = _ROTATIONS[tetromino_type]
+        self._cached_rot = -1
+        self._cached_offsets: List[Tuple[int, int]] = []
         
     def get_rotated_shape(self) -> Tuple[Tuple[int, ...], ...]:
         """Get the current rotation of the shape."""
-        shape = self.shape
-        rotations = [shape]
-        
-        # Generate all rotations
-        current = shape
-        for _ in range(3):
-            # Rotate 90 degrees clockwise
-            height = len(current)
-            width = len(current[0])
-            rotated = []
-            
-            for x in range(width):
-                row = []
-                for y in range(height - 1, -1, -1):
-                    row.append(current[y][x])
-                rotated.append(tuple(row))
-            
-            current = tuple(rotated)
-            rotations.append(current)
-        
-        return rotations[self.rotation % len(rotations)]
+        return self._rotations[self.rotation & 3]  # Every piece has exactly four rotations
     
     def get_width(self) -> int:
         """Get width of current rotation."""
@@ -68,18 +123,27 @@ class Tetromino:
     def rotate(self):
         """Rotate the piece."""
         self.rotation += 1
+        self._cached_rot = -1
+    
+    def get_block_offsets(self) -> List[Tuple[int, int]]:
+        """Get block offsets relative to the piece origin, cached per rotation."""
+        rotation = self.rotation % 4
+        if rotation != self._cached_rot:
+            # Rebuild the block offsets, walking the set bits of each row mask
+            offsets = []
+            for y, mask in enumerate(PIECE_ROTATIONS[self.type][rotation]):
+                while mask:
+                    bit = mask & -mask
+                    offsets.append((bit.bit_length() - 1, y))
+                    mask ^= bit
+            self._cached_rot = rotation
+            self._cached_offsets = offsets
+        
+        return self._cached_offsets
     
     def get_blocks(self) -> List[Tuple[int, int]]:
         """Get all block positions for current rotation."""
-        shape = self.get_rotated_shape()
-        blocks = []
-        
-        for y, row in enumerate(shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    blocks.append((self.x + x, self.y + y))
-        
-        return blocks
+        return [(self.x + ox, self.y + oy) for ox, oy in self.get_block_offsets()]
 
 class TetrisGame(BaseGame):
     """Classic Tetris game implementation."""
@@ -112,6 +176,8 @@ class TetrisGame(BaseGame):
         self.board = []
         self.current_piece = None
         self.next_piece_type = None
+        self._all_types = tuple(TetrominoType)
+        self._bag: List[TetrominoType] = []
         self.game_over = False
         self.paused = False
         self.level = 1
@@ -120,6 +186,8 @@ class TetrisGame(BaseGame):
         self.drop_timer = 0
         self.drop_speed = 1.0
         self.last_update = 0
+        self.time_limit = 0  # Seconds; 0 means untimed
+        self.start_time = 0.0
         
         # Controls
         self.drop_key_pressed = False
@@ -134,13 +202,12 @@ class TetrisGame(BaseGame):
         
         # Game loop
         self.running = True
-        clock = time.time()
+        clock = time.monotonic()
         
         while self.running and not self.game_over:
-            current_time = time.time()
-            
-            # Handle input
+            # Handle input; getch waits up to one frame, so it also paces the loop
             self._handle_game_input(screen)
+            current_time = time.monotonic()
             
             # Update game state
             if not self.paused:
@@ -149,13 +216,16 @@ class TetrisGame(BaseGame):
             
             # Render
             self._render(screen)
-            
-            # Small delay
-            time.sleep(0.016)  # ~60 FPS
         
         self.cleanup_screen(screen)
         return self.score
     
+    def setup_screen(self, screen):
+        """Setup the screen with a one-frame input timeout."""
+        super().setup_screen(screen)
+        screen.nodelay(False)
+        screen.timeout(16)  # getch returns -1 after ~16 ms (~60 FPS)
+    
     def _initialize_game(self, mode, **kwargs):
         """Initialize game state."""
         self.game_over = False
@@ -165,31 +235,59 @@ class TetrisGame(BaseGame):
         self.lines_cleared = 0
         self.current_mode = mode
         
-        # Initialize board
-        self.board = [[0 for _ in range(self.width)] for _ in range(self.height)]
+        # Color attributes are fixed once curses is set up
+        self._has_colors = curses.has_colors()
+        self._attr_filled = curses.color_pair(3) if self._has_colors else 0
+        self._attr_empty = curses.color_pair(2) if self._has_colors else 0
+        self._attr_piece = (curses.color_pair(4) | curses.A_BOLD) if self._has_colors else curses.A_BOLD
+        self._attr_ghost = self._attr_empty
+        self._attr_preview = curses.color_pair(4) if self._has_colors else 0
+        self._last_preview_type = None
+        self._prev_rows: List[Optional[str]] = [None] * self.height
+        self._dirty_ui = True
+        self._time_text: Optional[str] = None
+        
+        # Initialize board: one bitmask per row, bit x set when column x is filled
+        self.board = [0] * self.height
+        self._full_row = (1 << self.width) - 1
+        self._border_top = '┌' + '─' * self.width + '┐'
+        self._border_bottom = '└' + '─' * self.width + '┘'
+        self._screen_size = None
+        self._needs_border_redraw = True
+        # Topmost filled row per column (self.height when the column is empty)
+        self.col_heights = [self.height] * self.width
         
         # Mode-specific settings
+        self.time_limit = 0
         if mode == GameMode.TIME_ATTACK:
             self.time_limit = 300  # 5 minutes
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
         elif mode == GameMode.SPEEDRUN:
             self.drop_speed = 2.0  # Faster for speedrun
             self.time_limit = 180  # 3 minutes
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
         else:
             self.drop_speed = 1.0
         
         # Create first pieces
-        self.next_piece_type = random.choice(list(TetrominoType))
+        self._bag = []
+        self.next_piece_type = self._next_type()
         self._spawn_new_piece()
     
+    def _next_type(self) -> TetrominoType:
+        """Draw the next piece type from a shuffled bag of all seven."""
+        if not self._bag:
+            self._bag = list(self._all_types)
+            random.shuffle(self._bag)
+        return self._bag.pop()
+    
     def _spawn_new_piece(self):
         """Spawn a new piece at the top."""
         if not self.next_piece_type:
-            self.next_piece_type = random.choice(list(TetrominoType))
+            self.next_piece_type = self._next_type()
         
         piece_type = self.next_piece_type
-        self.next_piece_type = random.choice(list(TetrominoType))
+        self.next_piece_type = self._next_type()
         
         # Start position (top center)
         start_x = self.width // 2 - 1
@@ -206,16 +304,21 @@ class TetrisGame(BaseGame):
         test_x = piece.x + dx
         test_y = piece.y + dy
         
-        for x, y in piece.get_blocks():
-            new_x = test_x + (x - piece.x)
-            new_y = test_y + (y - piece.y)
-            
-            # Check boundaries
-            if new_x < 0 or new_x >= self.width or new_y >= self.height:
-                return True
-            
-            # Check board collision
-            if new_y >= 0 and self.board[new_y][new_x]:
+        rotation = piece.rotation % 4
+        rows = PIECE_ROTATIONS[piece.type][rotation]
+        
+        # Rotations are trimmed to their bounding box, so the walls and floor
+        # reduce to comparisons against the box edges
+        if test_x < 0 or test_x + _PIECE_WIDTHS[piece.type, rotation] > self.width:
+            return True
+        if test_y + len(rows) > self.height:
+            return True
+        
+        # Check board collision
+        board = self.board
+        for i, row_mask in enumerate(rows):
+            new_y = test_y + i
+            if new_y >= 0 and board[new_y] & (row_mask << test_x):
                 return True
         
         return False
@@ -226,9 +329,18 @@ class TetrisGame(BaseGame):
             return
         
         # Add piece to board
-        for x, y in self.current_piece.get_blocks():
-            if 0 <= y < self.height and 0 <= x < self.width:
-                self.board[y][x] = 1
+        piece = self.current_piece
+        for i, row_mask in enumerate(PIECE_ROTATIONS[piece.type][piece.rotation % 4]):
+            y = piece.y + i
+            if 0 <= y < self.height:
+                self.board[y] |= (row_mask << piece.x) & self._full_row
+        
+        col_heights = self.col_heights
+        for ox, oy in piece.get_block_offsets():
+            px = piece.x + ox
+            py = piece.y + oy
+            if 0 <= py < col_heights[px]:
+                col_heights[px] = py
         
         # Check for completed lines
         self._clear_lines()
@@ -238,40 +350,71 @@ class TetrisGame(BaseGame):
     
     def _clear_lines(self):
         """Clear completed lines and update score."""
-        lines_cleared = 0
-        
-        y = self.height - 1
-        while y >= 0:
-            if all(self.board[y]):  # Line is full
-                # Remove line
-                del self.board[y]
-                # Add empty line at top
-                self.board.insert(0, [0 for _ in range(self.width)])
-                lines_cleared += 1
-            else:
-                y -= 1
+        # Keep every row that isn't full, then pad the top with empty rows
+        full_row = self._full_row
+        remaining = [row for row in self.board if row != full_row]
+        lines_cleared = self.height - len(remaining)
         
         # Update score based on lines cleared
         if lines_cleared > 0:
+            self.board = [0] * lines_cleared + remaining
+            self._recompute_col_heights()
             self.lines_cleared += lines_cleared
-            line_scores = [0, 100, 300, 500, 800]  # 0, 1, 2, 3, 4 lines
-            line_score = line_scores[min(lines_cleared, 4)] * self.level
+            line_score = _LINE_SCORES[lines_cleared if lines_cleared < 5 else 4] * self.level
             self.score += line_score
+            self._dirty_ui = True
             
             # Level progression
             if self.lines_cleared >= self.level * 10:
                 self.level += 1
                 self.drop_speed = max(0.5, self.drop_speed - 0.1)  # Speed up
     
+    def _recompute_col_heights(self):
+        """Rebuild the per-column top filled row from the board."""
+        board = self.board
+        for x in range(self.width):
+            bit = 1 << x
+            self.col_heights[x] = next((y for y, row in enumerate(board) if row & bit), self.height)
+    
+    def _drop_distance(self, piece: Tetromino) -> int:
+        """Return how many rows the piece can fall before it lands."""
+        col_heights = self.col_heights
+        drop = self.height
+        for c, low in _LOWEST_CELLS[piece.type, piece.rotation % 4]:
+            gap = col_heights[piece.x + c] - (piece.y + low) - 1
+            if gap < 0:
+                # Piece is tucked under an overhang; step down row by row.
+                # Only vertical movement is tested, so the wall checks are skipped.
+                board = self.board
+                height = self.height
+                x = piece.x
+                rows = PIECE_ROTATIONS[piece.type][piece.rotation % 4]
+                drop = 0
+                while True:
+                    y = piece.y + drop + 1
+                    for i, row_mask in enumerate(rows):
+                        yy = y + i
+                        if yy >= height or (yy >= 0 and board[yy] & (row_mask << x)):
+                            return drop
+                    drop += 1
+            if gap < drop:
+                drop = gap
+        return drop
+    
     def _handle_game_input(self, screen):
         """Handle keyboard input."""
         key = screen.getch()
         
+        if key == -1:  # No input this frame
+            self.drop_key_pressed = False
+            return
+        
         if key == 27:  # ESC
             self.running = False
             return
         elif key in [ord('p'), ord('P')]:
             self.paused = not self.paused
+            self._needs_border_redraw = True  # Repaint over the pause overlay
             return
         
         if self.paused or self.game_over:
@@ -293,15 +436,15 @@ class TetrisGame(BaseGame):
             if not self._check_collision(self.current_piece, dy=1):
                 self.current_piece.y += 1
                 self.score += 1  # Soft drop bonus
+                self._dirty_ui = True
         
         elif key in [ord(' ')] and not self.drop_key_pressed:  # Space
             # Hard drop
-            drop_distance = 0
-            while not self._check_collision(self.current_piece, dy=1):
-                self.current_piece.y += 1
-                drop_distance += 1
+            drop_distance = self._drop_distance(self.current_piece)
+            self.current_piece.y += drop_distance
             
             self.score += drop_distance * 2  # Hard drop bonus
+            self._dirty_ui = True
             self.drop_key_pressed = True
         
         elif key in [curses.KEY_UP, ord('w'), ord('W')]:
@@ -324,8 +467,8 @@ class TetrisGame(BaseGame):
     def _update(self, dt: float):
         """Update game state."""
         # Check time limit for timed modes
-        if hasattr(self, 'time_limit') and self.time_limit > 0:
-            elapsed = time.time() - self.start_time
+        if self.time_limit > 0:
+            elapsed = time.monotonic() - self.start_time
             if elapsed >= self.time_limit:
                 self.game_over = True
                 return
@@ -345,110 +488,149 @@ class TetrisGame(BaseGame):
     
     def _render(self, screen):
         """Render the game."""
-        screen.clear()
         height, width = screen.getmaxyx()
         
-        # Draw title
-        title = f"TETRIS - Level {self.level}"
-        screen.addstr(0, (width - len(title)) // 2, title, curses.A_BOLD)
+        # Layout only changes when the terminal is resized
+        if (height, width) != self._screen_size:
+            self._screen_size = (height, width)
+            game_width = self.width + 4  # Include borders
+            game_height = self.height + 2  # Include borders
+            self._game_x = (width - game_width) // 2
+            self._game_y = (height - game_height) // 2
+            self._ui_x = self._game_x + game_width + 2
+            self._needs_border_redraw = True
+        
+        # Static parts are only repainted after a resize or an overlay;
+        # everything else is overwritten in place when it changes
+        changed = self._needs_border_redraw
+        if self._needs_border_redraw:
+            screen.erase()
+            self._draw_border(screen, self._game_x, self._game_y)
+            
+            # Draw controls hint
+            controls_text = "Arrow Keys/WASD: Move/Rotate | Space: Drop | P: Pause | ESC: Quit"
+            screen.addstr(height - 1, (width - len(controls_text)) // 2, controls_text)
+            self._needs_border_redraw = False
+            
+            # Nothing dynamic is on screen any more
+            self._prev_rows = [None] * self.height
+            self._last_preview_type = None
+            self._time_text = None
+            self._dirty_ui = True
         
-        # Calculate game area position (centered)
-        game_width = self.width + 4  # Include borders
-        game_height = self.height + 2  # Include borders
-        game_x = (width - game_width) // 2
-        game_y = (height - game_height) // 2
+        # Draw title
+        if self._dirty_ui:
+            title = f"TETRIS - Level {self.level}"
+            screen.addstr(0, (width - len(title)) // 2, title, curses.A_BOLD)
         
         # Draw game board
-        self._draw_board(screen, game_x, game_y)
+        changed |= self._draw_board(screen, self._game_x, self._game_y)
         
         # Draw UI
-        self._draw_ui(screen, game_x + game_width + 2, game_y)
+        changed |= self._draw_ui(screen, self._ui_x, self._game_y)
+        
+        # The window is already an off-screen buffer flushed by refresh(),
+        # so a frame that wrote nothing needs no terminal update at all
+        if not changed:
+            return
         
         # Draw pause overlay if paused
         if self.paused:
             self._draw_pause_overlay(screen)
         
-        # Draw controls hint
-        controls_text = "Arrow Keys/WASD: Move/Rotate | Space: Drop | P: Pause | ESC: Quit"
-        screen.addstr(height - 1, (width - len(controls_text)) // 2, controls_text)
-        
         screen.refresh()
     
-    def _draw_board(self, screen, x: int, y: int):
-        """Draw the game board."""
-        # Draw border
-        screen.addch(y - 1, x - 1, '┌')
-        screen.addch(y - 1, x + self.width, '┐')
-        screen.addch(y + self.height, x - 1, '└')
-        screen.addch(y + self.height, x + self.width, '┘')
-        
-        for i in range(self.width):
-            screen.addch(y - 1, x + i, '─')
-            screen.addch(y + self.height, x + i, '─')
-        
+    def _draw_border(self, screen, x: int, y: int):
+        """Draw the board border."""
+        screen.addstr(y - 1, x - 1, self._border_top)
         for i in range(self.height):
             screen.addch(y + i, x - 1, '│')
             screen.addch(y + i, x + self.width, '│')
-        
-        # Draw board content
+        screen.addstr(y + self.height, x - 1, self._border_bottom)
+    
+    def _draw_board(self, screen, x: int, y: int) -> bool:
+        """Draw the game board, returning whether any row was rewritten."""
+        # Cells covered by the ghost and the current piece; the piece wins where they overlap
+        overlay = {}
+        piece = self.current_piece
+        if piece:
+            offsets = piece.get_block_offsets()
+            ghost_y = piece.y + self._drop_distance(piece)
+            for ox, oy in offsets:
+                overlay[piece.x + ox, ghost_y + oy] = ('□', self._attr_ghost)
+            for ox, oy in offsets:
+                overlay[piece.x + ox, piece.y + oy] = ('■', self._attr_piece)
+        
+        filled = ('█', self._attr_filled)
+        empty = ('·', self._attr_empty)
+        
+        # Compose each row and, if it differs from what is on screen, write it
+        # as one addstr per run of equal attributes
+        prev_rows = self._prev_rows
+        changed = False
         for py in range(self.height):
+            row = self.board[py]
+            chars = []
+            attrs = []
             for px in range(self.width):
-                board_val = self.board[py][px]
-                if board_val:
-                    screen.addch(y + py, x + px, '█', curses.color_pair(3) if curses.has_colors() else 0)
-                else:
-                    screen.addch(y + py, x + px, '·', curses.color_pair(2) if curses.has_colors() else 0)
-        
-        # Draw current piece
-        if self.current_piece:
-            for px, py in self.current_piece.get_blocks():
-                if 0 <= py < self.height and 0 <= px < self.width:
-                    screen.addch(y + py, x + px, '■', 
-                               curses.color_pair(4) | curses.A_BOLD if curses.has_colors() else curses.A_BOLD)
-        
-        # Draw ghost piece (where piece will land)
-        if self.current_piece:
-            ghost_y = self.current_piece.y
-            while not self._check_collision(self.current_piece, dy=ghost_y - self.current_piece.y + 1):
-                ghost_y += 1
+                char, attr = overlay.get((px, py)) or (filled if row >> px & 1 else empty)
+                chars.append(char)
+                attrs.append(attr)
             
-            for px, py in self.current_piece.get_blocks():
-                ghost_px = px + (ghost_y - self.current_piece.y)
-                if 0 <= py < self.height and 0 <= px < self.width:
-                    screen.addch(y + ghost_py, x + ghost_px, '□', 
-                               curses.color_pair(2) if curses.has_colors() else 0)
-    
-    def _draw_ui(self, screen, x: int, y: int):
-        """Draw UI elements."""
-        # Score and stats
-        ui_lines = [
-            f"Score: {self.score}",
-            f"Level: {self.level}",
-            f"Lines: {self.lines_cleared}",
-            f"Speed: {self.drop_speed:.1f}x"
-        ]
+            # Each glyph has a single attribute, so the text alone identifies the row
+            line = ''.join(chars)
+            if line == prev_rows[py]:
+                continue
+            prev_rows[py] = line
+            changed = True
+            
+            run_start = 0
+            for i in range(1, len(chars) + 1):
+                if i == len(chars) or attrs[i] != attrs[run_start]:
+                    screen.addstr(y + py, x + run_start, line[run_start:i], attrs[run_start])
+                    run_start = i
         
-        if hasattr(self, 'time_limit') and self.time_limit > 0:
-            elapsed = time.time() - self.start_time
+        return changed
+    
+    def _draw_ui(self, screen, x: int, y: int) -> bool:
+        """Draw UI elements, returning whether anything was rewritten."""
+        # Score and stats, rewritten only when one of them changes
+        changed = self._dirty_ui
+        if self._dirty_ui:
+            self._dirty_ui = False
+            screen.addstr(y, x, f"Score: {self.score}")
+            screen.addstr(y + 1, x, f"Level: {self.level}")
+            screen.addstr(y + 2, x, f"Lines: {self.lines_cleared}")
+            screen.addstr(y + 3, x, f"Speed: {self.drop_speed:.1f}x")
+        ui_height = 4
+        
+        if self.time_limit > 0:
+            elapsed = time.monotonic() - self.start_time
             remaining = max(0, self.time_limit - elapsed)
-            ui_lines.append(f"Time: {remaining:.1f}s")
-        
-        for i, line in enumerate(ui_lines):
-            screen.addstr(y + i, x, line)
-        
-        # Next piece preview
-        screen.addstr(y + len(ui_lines) + 2, x, "Next:", curses.A_BOLD)
-        if self.next_piece_type:
-            self._draw_tetromino_preview(screen, self.next_piece_type, x + 2, y + len(ui_lines) + 4)
+            time_text = f"Time: {remaining:.1f}s".ljust(12)  # Pad over a shrinking value
+            if time_text != self._time_text:
+                self._time_text = time_text
+                screen.addstr(y + 4, x, time_text)
+                changed = True
+            ui_height = 5
+        
+        # Next piece preview, redrawn when the upcoming piece changes
+        if self.next_piece_type and self.next_piece_type is not self._last_preview_type:
+            self._last_preview_type = self.next_piece_type
+            screen.addstr(y + ui_height + 2, x, "Next:", curses.A_BOLD)
+            self._draw_tetromino_preview(screen, self.next_piece_type, x + 2, y + ui_height + 4)
+            changed = True
+        
+        return changed
     
     def _draw_tetromino_preview(self, screen, tetromino_type: TetrominoType, x: int, y: int):
         """Draw a small preview of a tetromino."""
-        shape = tetromino_type.value
+        # Pad to a fixed 4x2 box so a smaller piece covers the previous preview
+        rows = [''.join('█' if cell else ' ' for cell in row).ljust(4) for row in tetromino_type.value]
+        rows += [' ' * 4] * (2 - len(rows))
         
-        for py, row in enumerate(shape):
-            for px, cell in enumerate(row):
-                if cell:
-                    screen.addch(y + py, x + px, '█', curses.color_pair(4) if curses.has_colors() else 0)
+        for py, row in enumerate(rows):
+            screen.addstr(y + py, x, row, self._attr_preview)
     
     def _draw_pause_overlay(self, screen):
         """Draw pause overlay."""
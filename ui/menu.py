@@ -5,9 +5,32 @@ Provides interactive menu navigation with smooth animations and preview support.
 
 import curses
 import time
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple, Iterable
 from enum import Enum
 
+# Input timeout while a menu is shown; getch returns -1 after this long so
+# animations keep ticking without busy-waiting
+_FRAME_DELAY_MS = 16
+
+# Theme colors the menu color pairs currently hold, see _init_colors
+_colors_theme: Optional[Tuple[int, ...]] = None
+
+def _init_colors(theme: Dict[str, Any]):
+    """Define the menu color pairs for a theme, unless they already hold it."""
+    global _colors_theme
+    colors = (theme['text'], theme['selected'], theme['title'], theme['border'], theme['description'])
+    if colors == _colors_theme:
+        return  # Submenus and repeat visits reuse the pairs as they are
+    
+    if _colors_theme is None:
+        curses.start_color()
+        curses.use_default_colors()
+    
+    # Define color pairs
+    for pair, color in enumerate(colors, 1):
+        curses.init_pair(pair, color, curses.COLOR_BLACK)
+    _colors_theme = colors
+
 class MenuAction(Enum):
     """Menu item actions."""
     SELECT = "select"
@@ -17,6 +40,7 @@ class MenuAction(Enum):
 
 class MenuItem:
     """Represents a single menu item."""
+    __slots__ = ('text', 'action', 'data', 'description', 'submenu', 'selected')
     
     def __init__(self, text: str, action: MenuAction = MenuAction.SELECT, 
                  data: Any = None, description: str = "", submenu: 'Menu' = None):
@@ -40,10 +64,33 @@ class Menu:
         self.show_descriptions = True
         self.parent_menu: Optional['Menu'] = None
         
+        # Regions that need repainting on the next draw; 'items' holds item indices
+        self._dirty: Dict[str, Any] = {'all': True, 'list': False, 'items': set(), 'scroll': False}
+        # Strings and positions derived from the terminal size and title, see _geometry
+        self._geom_cache: Dict[str, Any] = {}
+        # Terminal size as (height, width), queried again only after a resize
+        self._size: Optional[Tuple[int, int]] = None
+        
+        # Key bindings as key code -> (command, argument)
+        self._keymap: Dict[int, Tuple[str, int]] = {
+            curses.KEY_UP: ('move', -1), ord('k'): ('move', -1),
+            curses.KEY_DOWN: ('move', 1), ord('j'): ('move', 1),
+            curses.KEY_PPAGE: ('move', -5), curses.KEY_NPAGE: ('move', 5),
+            curses.KEY_ENTER: ('select', 0), 10: ('select', 0), 13: ('select', 0),
+            curses.KEY_RESIZE: ('resize', 0),
+            12: ('redraw', 0),  # Ctrl-L: repaint the terminal from scratch
+            27: ('back', 0),  # ESC
+            ord('q'): ('quit', 0),
+        }
+        
     def add_item(self, item: MenuItem):
         """Add an item to the menu."""
         self.items.append(item)
     
+    def extend_items(self, items: Iterable[MenuItem]):
+        """Add several items to the menu at once."""
+        self.items.extend(items)
+    
     def add_text(self, text: str, description: str = "", data: Any = None):
         """Add a simple text item that can be selected."""
         item = MenuItem(text, MenuAction.SELECT, data, description)
@@ -78,38 +125,50 @@ class Menu:
         
         # Setup colors if available
         if curses.has_colors():
-            curses.start_color()
-            curses.use_default_colors()
-            
-            # Define color pairs
-            curses.init_pair(1, theme['text'], curses.COLOR_BLACK)
-            curses.init_pair(2, theme['selected'], curses.COLOR_BLACK)
-            curses.init_pair(3, theme['title'], curses.COLOR_BLACK)
-            curses.init_pair(4, theme['border'], curses.COLOR_BLACK)
-            curses.init_pair(5, theme['description'], curses.COLOR_BLACK)
+            _init_colors(theme)
         
         # Hide cursor
         curses.curs_set(0)
-        stdscr.nodelay(0)  # Blocking input
         
+        # Whatever was shown before (a game, another menu) is still on screen,
+        # and the terminal may have been resized meanwhile
+        self._dirty['all'] = True
+        self._size = None
+        
+        stdscr.timeout(_FRAME_DELAY_MS)
+        try:
+            return self._input_loop(stdscr, theme)
+        finally:
+            stdscr.timeout(-1)  # Callers expect blocking input again
+    
+    def _input_loop(self, stdscr, theme: Dict[str, Any]) -> Optional[MenuItem]:
+        """Run the draw/input loop until an item is chosen or the menu is left."""
+        force_redraw = False
         while True:
-            self.draw(stdscr, theme)
+            # Idle timeouts leave nothing dirty, so they cost no drawing at all
+            if force_redraw or self._dirty_any():
+                self.draw(stdscr, theme, force_redraw)
+                force_redraw = False
+                curses.doupdate()  # One physical update per pass, after everything is staged
             key = stdscr.getch()
             
-            # Handle input
-            if key == curses.KEY_UP or key == ord('k'):
-                self.selected_index = max(0, self.selected_index - 1)
-                self._adjust_scroll()
-            elif key == curses.KEY_DOWN or key == ord('j'):
-                self.selected_index = min(len(self.items) - 1, self.selected_index + 1)
-                self._adjust_scroll()
-            elif key == curses.KEY_PPAGE:  # Page up
-                self.selected_index = max(0, self.selected_index - 5)
-                self._adjust_scroll()
-            elif key == curses.KEY_NPAGE:  # Page down
-                self.selected_index = min(len(self.items) - 1, self.selected_index + 5)
-                self._adjust_scroll()
-            elif key in [curses.KEY_ENTER, 10, 13]:  # Enter
+            if key == -1:  # Timed out with no input: just advance the animation
+                self.animation_time += _FRAME_DELAY_MS / 1000
+                continue
+            
+            action = self._keymap.get(key)
+            if action is None:
+                continue
+            command, arg = action
+            
+            if command == 'move':
+                self._move_selection(max(0, min(len(self.items) - 1, self.selected_index + arg)))
+            elif command == 'resize':
+                self._size = None
+                self._dirty['all'] = True
+            elif command == 'redraw':
+                force_redraw = True
+            elif command == 'select':
                 if self.items:
                     selected_item = self.items[self.selected_index]
                     
@@ -118,80 +177,184 @@ class Menu:
                         result = selected_item.data.show(stdscr, theme)
                         if result is not None:
                             return result
+                        stdscr.timeout(_FRAME_DELAY_MS)  # The submenu restored blocking input
+                        self._dirty['all'] = True  # The submenu painted over us
+                        self._size = None
                     else:
                         return selected_item
-            elif key == 27:  # ESC
+            elif command == 'back':
                 if self.parent_menu:
                     return MenuItem("Back", MenuAction.BACK)
                 else:
                     return MenuItem("Exit", MenuAction.EXIT)
-            elif key == ord('q'):
+            elif command == 'quit':
                 return MenuItem("Exit", MenuAction.EXIT)
+    
+    def draw(self, stdscr, theme: Dict[str, Any], force_redraw: bool = False):
+        """Draw the menu, repainting only the regions marked dirty.
+        
+        The window is only staged with noutrefresh; the caller flushes it to
+        the terminal with curses.doupdate().
+        
+        With force_redraw every line is retransmitted on the next update, for
+        when the terminal's contents no longer match what curses believes.
+        """
+        if self._size is None:
+            self._size = stdscr.getmaxyx()
+        height, width = self._size
+        geom = self._geometry(height, width)  # Marks everything dirty when the layout changed
+        dirty = self._dirty
+        
+        start_y, max_items = self._item_area(height)
+        
+        if dirty['all']:
+            stdscr.erase()
+            
+            # Draw border
+            self._draw_border(stdscr, geom)
+            
+            # Draw title
+            self._draw_title(stdscr, geom)
+            
+            # Draw menu items
+            self._draw_items(stdscr, start_y, max_items, height, width)
+            
+            # Draw scroll indicator if needed
+            self._draw_scrollbar(stdscr, start_y, max_items, height, width)
             
-            # Update animation
-            self.animation_time += 0.1
+            # Draw help text at bottom
+            self._draw_help(stdscr, geom)
+        elif dirty['list']:
+            # Scrolling moves every visible item, but the frame around the list stays put
+            blank = " " * (width - 2)
+            for y in range(start_y, height - 2):
+                stdscr.addstr(y, 1, blank)
+            if geom['title_in_list']:
+                self._draw_title(stdscr, geom)  # Items still paint over it, as in a full repaint
+            self._draw_items(stdscr, start_y, max_items, height, width)
+            self._draw_scrollbar(stdscr, start_y, max_items, height, width)
+        else:
+            # Selection only changes the item's own row; its description is unaffected
+            for index in dirty['items']:
+                self._draw_item(stdscr, index, start_y, height, width)
+            
+            if dirty['scroll']:
+                self._draw_scrollbar(stdscr, start_y, max_items, height, width)
+        
+        dirty['all'] = dirty['list'] = dirty['scroll'] = False
+        dirty['items'].clear()
+        
+        if force_redraw:
+            stdscr.redrawln(0, height)
+        
+        stdscr.noutrefresh()
     
-    def draw(self, stdscr, theme: Dict[str, Any]):
-        """Draw the menu."""
-        stdscr.clear()
-        height, width = stdscr.getmaxyx()
+    def _dirty_any(self) -> bool:
+        """Whether any region is waiting to be repainted."""
+        dirty = self._dirty
+        return dirty['all'] or dirty['list'] or dirty['scroll'] or bool(dirty['items'])
+    
+    def _item_area(self, height: int) -> Tuple[int, int]:
+        """Return the first row and the number of rows available for items."""
+        start_y = 7 if self.title else 3
+        max_items = height - start_y - 3
+        if max_items < 1:
+            max_items = 1
+        return start_y, max_items
+    
+    def _geometry(self, height: int, width: int) -> Dict[str, Any]:
+        """Return the size- and title-dependent strings, rebuilding them only when those change."""
+        key = (height, width, self.title, self.subtitle)
+        geom = self._geom_cache
+        if geom.get('key') == key:
+            return geom
         
-        # Draw border
-        self._draw_border(stdscr, theme)
+        geom.clear()
+        geom['key'] = key
+        geom['height'] = height
+        geom['width'] = width
+        geom['top_border'] = "╔" + "═" * (width - 2) + "╗"
+        geom['bottom_border'] = "╚" + "═" * (width - 2) + "╝"
         
-        # Draw title
+        # Title lines as (y, x, text)
+        geom['title'] = []
         if self.title:
-            title_lines = self.title.split('\n')
-            for i, line in enumerate(title_lines):
+            for i, line in enumerate(self.title.split('\n')):
                 title_y = 2 + i
                 if title_y < height - 2:
                     title_text = f" {line} "[:width-4]
-                    title_x = (width - len(title_text)) // 2
-                    stdscr.addstr(title_y, title_x, title_text, curses.color_pair(3) | curses.A_BOLD)
+                    geom['title'].append((title_y, (width - len(title_text)) // 2, title_text))
         
-        # Draw subtitle
+        geom['subtitle'] = None
         if self.subtitle and height > 5:
             subtitle_text = f" {self.subtitle} "[:width-4]
-            subtitle_x = (width - len(subtitle_text)) // 2
-            stdscr.addstr(4, subtitle_x, subtitle_text, curses.color_pair(5))
+            geom['subtitle'] = ((width - len(subtitle_text)) // 2, subtitle_text)
         
-        # Calculate visible area for menu items
-        start_y = 7 if self.title else 3
-        max_items = height - start_y - 3
-        if max_items < 1:
-            max_items = 1
+        # Whether the title or subtitle reaches into the rows the item list repaints
+        start_y, _ = self._item_area(height)
+        geom['title_in_list'] = (
+            any(title_y >= start_y for title_y, _, _ in geom['title'])
+            or (geom['subtitle'] is not None and 4 >= start_y)
+        )
         
-        # Draw menu items
-        visible_items = self.items[self.scroll_offset:self.scroll_offset + max_items]
-        for i, item in enumerate(visible_items):
-            y = start_y + i
+        help_text = "↑↓: Navigate | Enter: Select | ESC: Back | Q: Exit"
+        geom['help'] = ((width - len(help_text)) // 2, help_text) if len(help_text) < width - 4 else None
+        
+        # Everything on screen was laid out for the old geometry
+        self._dirty['all'] = True
+        return geom
+    
+    def _draw_title(self, stdscr, geom: Dict[str, Any]):
+        """Draw the title and subtitle."""
+        for title_y, title_x, title_text in geom['title']:
+            stdscr.addstr(title_y, title_x, title_text, curses.color_pair(3) | curses.A_BOLD)
+        
+        # Draw subtitle
+        if geom['subtitle']:
+            subtitle_x, subtitle_text = geom['subtitle']
+            stdscr.addstr(4, subtitle_x, subtitle_text, curses.color_pair(5))
+    
+    def _draw_items(self, stdscr, start_y: int, max_items: int, height: int, width: int):
+        """Draw every visible item; descriptions are painted in order so later items overlap earlier ones."""
+        for index in range(self.scroll_offset, min(len(self.items), self.scroll_offset + max_items)):
+            y = start_y + index - self.scroll_offset
             if y >= height - 2:
                 break
-                
-            # Determine if this item is selected
-            is_selected = (self.scroll_offset + i) == self.selected_index
-            
-            # Prepare the display text
-            prefix = "▶ " if is_selected else "  "
-            display_text = f"{prefix}{item.text}"[:width-6]
-            
-            # Apply colors
-            if is_selected:
-                attr = curses.color_pair(2) | curses.A_BOLD | curses.A_REVERSE
-            else:
-                attr = curses.color_pair(1)
-            
-            stdscr.addstr(y, 3, display_text, attr)
-            
-            # Draw description if available and there's space
-            if self.show_descriptions and item.description and height > y + 2:
-                desc_lines = item.description.split('\n')
-                for j, desc_line in enumerate(desc_lines[:2]):  # Max 2 lines of description
-                    if y + j + 1 < height - 2:
-                        desc_text = f"    └─ {desc_line}"[:width-8]
-                        stdscr.addstr(y + j + 1, 5, desc_text, curses.color_pair(5))
-        
-        # Draw scroll indicator if needed
+            self._draw_item(stdscr, index, start_y, height, width)
+            self._draw_description(stdscr, self.items[index], y, height, width)
+    
+    def _draw_item(self, stdscr, index: int, start_y: int, height: int, width: int):
+        """Draw a single item's text row, if it is in the visible window."""
+        y = start_y + index - self.scroll_offset
+        if index < self.scroll_offset or index >= len(self.items) or y >= height - 2:
+            return
+        
+        # Determine if this item is selected
+        is_selected = index == self.selected_index
+        
+        # Prepare the display text
+        prefix = "▶ " if is_selected else "  "
+        display_text = f"{prefix}{self.items[index].text}"[:width-6]
+        
+        # Apply colors
+        if is_selected:
+            attr = curses.color_pair(2) | curses.A_BOLD | curses.A_REVERSE
+        else:
+            attr = curses.color_pair(1)
+        
+        stdscr.addstr(y, 3, display_text, attr)
+    
+    def _draw_description(self, stdscr, item: MenuItem, y: int, height: int, width: int):
+        """Draw an item's description below its row if there's space."""
+        if self.show_descriptions and item.description and height > y + 2:
+            desc_lines = item.description.split('\n')
+            for j, desc_line in enumerate(desc_lines[:2]):  # Max 2 lines of description
+                if y + j + 1 < height - 2:
+                    desc_text = f"    └─ {desc_line}"[:width-8]
+                    stdscr.addstr(y + j + 1, 5, desc_text, curses.color_pair(5))
+    
+    def _draw_scrollbar(self, stdscr, start_y: int, max_items: int, height: int, width: int):
+        """Draw the scroll indicator when the items don't fit."""
         if len(self.items) > max_items:
             scroll_height = max(1, (max_items * max_items) // len(self.items))
             scroll_pos = start_y + (self.selected_index * (max_items - scroll_height)) // max(len(self.items) - max_items, 1)
@@ -202,37 +365,53 @@ class Menu:
                         stdscr.addch(y, width - 2, '█', curses.color_pair(4))
                     else:
                         stdscr.addch(y, width - 2, '░', curses.color_pair(4))
-        
-        # Draw help text at bottom
-        help_text = "↑↓: Navigate | Enter: Select | ESC: Back | Q: Exit"
-        if len(help_text) < width - 4:
-            help_x = (width - len(help_text)) // 2
-            stdscr.addstr(height - 1, help_x, help_text, curses.color_pair(4))
-        
-        stdscr.refresh()
     
-    def _draw_border(self, stdscr, theme: Dict[str, Any]):
+    def _draw_help(self, stdscr, geom: Dict[str, Any]):
+        """Draw help text at the bottom."""
+        if geom['help']:
+            help_x, help_text = geom['help']
+            stdscr.addstr(geom['height'] - 1, help_x, help_text, curses.color_pair(4))
+    
+    def _draw_border(self, stdscr, geom: Dict[str, Any]):
         """Draw a decorative border."""
-        height, width = stdscr.getmaxyx()
+        height, width = geom['height'], geom['width']
+        
+        attr = curses.color_pair(4)
         
         # Top border
-        stdscr.addstr(0, 0, "╔" + "═" * (width - 2) + "╗", curses.color_pair(4))
+        stdscr.addstr(0, 0, geom['top_border'], attr)
         
-        # Side borders
+        # Side borders; vline can't take '║', as it only accepts single-byte characters
+        addch = stdscr.addch
+        right = width - 1
         for y in range(1, height - 1):
-            stdscr.addch(y, 0, '║', curses.color_pair(4))
-            stdscr.addch(y, width - 1, '║', curses.color_pair(4))
+            addch(y, 0, '║', attr)
+            addch(y, right, '║', attr)
+        
+        # Bottom border; writing the bottom-right cell moves the cursor off the screen,
+        # which curses reports as an error even though the character was drawn
+        try:
+            stdscr.addstr(height - 1, 0, geom['bottom_border'], attr)
+        except curses.error:
+            pass
+    
+    def _move_selection(self, index: int):
+        """Select another item, marking only the rows that change as dirty."""
+        old_index = self.selected_index
+        old_offset = self.scroll_offset
+        self.selected_index = index
+        self._adjust_scroll()
         
-        # Bottom border
-        stdscr.addstr(height - 1, 0, "╚" + "═" * (width - 2) + "╝", curses.color_pair(4))
+        if self.scroll_offset != old_offset:
+            self._dirty['list'] = True  # Every visible row moved
+        elif index != old_index:
+            self._dirty['items'].update((old_index, index))
+            self._dirty['scroll'] = True
     
     def _adjust_scroll(self):
         """Adjust scroll offset to keep selection visible."""
-        height = curses.LINES  # Approximate terminal height
-        start_y = 7 if self.title else 3
-        max_items = height - start_y - 3
-        if max_items < 1:
-            max_items = 1
+        height = self._size[0] if self._size else curses.LINES
+        _, max_items = self._item_area(height)
         
         # Make sure selected item is visible
         if self.selected_index < self.scroll_offset:
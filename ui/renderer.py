@@ -5,7 +5,11 @@ Provides fonts, sprites, animations, and visual effects.
 
 import time
 import math
-from typing import Dict, List, Tuple, Optional
+import random
+import functools
+from itertools import compress
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Optional, Mapping, Sequence
 from enum import Enum
 
 class FontStyle(Enum):
@@ -16,380 +20,486 @@ class FontStyle(Enum):
     SLANT = "slant"
     SMALL = "small"
 
+# Standard ASCII font
+_STANDARD_FONT: Dict[str, List[str]] = {
+    'A': [
+        "  ▄▄▄   ",
+        " ▐█ █▌  ",
+        "▐█▄▄█▄▌ ",
+        "▐█  █▌  ",
+        " ▀  ▀   "
+    ],
+    'B': [
+        "▄▄▄▄▄   ",
+        "▐█ █▌   ",
+        "▐▀▀▀▀▄▄ ",
+        "▐█   █▌ ",
+        " ▀▀▀▀▀  "
+    ],
+    'C': [
+        " ▄▄▄▄▄  ",
+        "▐█      ",
+        "▐█      ",
+        "▐█      ",
+        " ▀▀▀▀▀  "
+    ],
+    'D': [
+        "▄▄▄▄▄   ",
+        "▐█ █▌   ",
+        "▐█  █▌  ",
+        "▐█ █▌   ",
+        " ▀▀▀▀   "
+    ],
+    'E': [
+        "▄▄▄▄▄▄▄ ",
+        "▐█      ",
+        "▐▀▀▀▀▀▀ ",
+        "▐█      ",
+        " ▀▀▀▀▀▀ "
+    ],
+    'F': [
+        "▄▄▄▄▄▄▄ ",
+        "▐█      ",
+        "▐▀▀▀▀▀▀ ",
+        "▐█      ",
+        "▀       "
+    ],
+    'G': [
+        " ▄▄▄▄▄  ",
+        "▐█      ",
+        "▐█  ▄▄▄▌",
+        "▐█ █▌ █▌",
+        " ▀▀▀▀▀  "
+    ],
+    'H': [
+        "▄▄   ▄▄ ",
+        "▐█   █▌ ",
+        "▐█████▌ ",
+        "▐█   █▌ ",
+        "▀    ▀  "
+    ],
+    'I': [
+        "▄▄▄▄▄▄▄",
+        "   █   ",
+        "   █   ",
+        "   █   ",
+        " ▀▀▀▀▀ "
+    ],
+    'L': [
+        "▄       ",
+        "▐█      ",
+        "▐█      ",
+        "▐█████▌ ",
+        " ▀▀▀▀▀ "
+    ],
+    'M': [
+        "▄▄    ▄▄ ",
+        "▐██  ██▌ ",
+        "▐█ █ ██▌ ",
+        "▐█  ▐█▌  ",
+        "▀    ▀   "
+    ],
+    'N': [
+        "▄▄   ▄▄ ",
+        "▐██▄ ▐█▌ ",
+        "▐█ ████▌ ",
+        "▐█▌  ███ ",
+        "▀    ▀  "
+    ],
+    'O': [
+        " ▄▄▄▄▄  ",
+        "▐█   █▌ ",
+        "▐█   █▌ ",
+        "▐█   █▌ ",
+        " ▀▀▀▀▀  "
+    ],
+    'P': [
+        "▄▄▄▄▄   ",
+        "▐█ █▌   ",
+        "▐▀▀▀▀▄▄ ",
+        "▐█      ",
+        " ▀      "
+    ],
+    'R': [
+        "▄▄▄▄▄   ",
+        "▐█ █▌   ",
+        "▐▀▀▀▀▄▄ ",
+        "▐█   █▌ ",
+        " ▀▀▀▀▀  "
+    ],
+    'S': [
+        " ▄▄▄▄▄  ",
+        "▐█      ",
+        " ▀▀▀▀▀▄ ",
+        "      █▌",
+        " ▀▀▀▀▀  "
+    ],
+    'T': [
+        "▄▄▄▄▄▄▄",
+        "   █   ",
+        "   █   ",
+        "   █   ",
+        "   ▀   "
+    ],
+    'U': [
+        "▄▄   ▄▄ ",
+        "▐█   █▌ ",
+        "▐█   █▌ ",
+        "▐█   █▌ ",
+        " ▀▀▀▀▀  "
+    ],
+    'V': [
+        "▄▄   ▄▄ ",
+        "▐█   █▌ ",
+        "▐█   █▌ ",
+        " ▐█ █▌  ",
+        "  ▀▀   "
+    ],
+    'W': [
+        "▄▄    ▄▄ ",
+        "▐█    █▌ ",
+        "▐█ █ ██▌ ",
+        "▐██  ██▌ ",
+        "▀    ▀  "
+    ],
+    'Y': [
+        "▄▄   ▄▄ ",
+        "▐█   █▌ ",
+        " ▐█ █▌  ",
+        "   █   ",
+        "   ▀   "
+    ],
+    ' ': [
+        "       ",
+        "       ",
+        "       ",
+        "       ",
+        "       "
+    ],
+    '!': [
+        "   ▄   ",
+        "   █   ",
+        "   █   ",
+        "       ",
+        "   ▀   "
+    ],
+    '?': [
+        " ▄▄▄▄▄ ",
+        "▐█    █▌",
+        "    █  ",
+        "   ▄   ",
+        "   ▀   "
+    ],
+    '0': [
+        " ▄▄▄▄▄ ",
+        "▐█ █ █▌",
+        "▐█ █ █▌",
+        "▐█ █ █▌",
+        " ▀▀▀▀▀ "
+    ],
+    '1': [
+        "  ▄▄  ",
+        " ▐█ █▌",
+        "   █ ",
+        "   █ ",
+        " ▀▀▀▀"
+    ],
+    '2': [
+        " ▄▄▄▄▄ ",
+        "▐█    █▌",
+        "   ▄▄▄▌",
+        "▐█    ",
+        " ▀▀▀▀▀▀"
+    ],
+    '3': [
+        " ▄▄▄▄▄ ",
+        "▐█    █▌",
+        "   ███ ",
+        "▐█    █▌",
+        " ▀▀▀▀▀ "
+    ],
+    '4': [
+        "▄▄   ▄▄",
+        "▐█   █▌",
+        "▐█████▌",
+        "    █ ",
+        "    ▀ "
+    ],
+    '5': [
+        "▄▄▄▄▄▄▄",
+        "▐█     ",
+        "▀▀▀▀▀▄▄",
+        "     █▌",
+        "▀▀▀▀▀▀ "
+    ],
+    '6': [
+        " ▄▄▄▄▄  ",
+        "▐█      ",
+        "▐████▄▄ ",
+        "▐█   █▌ ",
+        " ▀▀▀▀▀  "
+    ],
+    '7': [
+        "▄▄▄▄▄▄▄▄",
+        "      █▌",
+        "    █  ",
+        "   █   ",
+        "  ▀    "
+    ],
+    '8': [
+        " ▄▄▄▄▄  ",
+        "▐█   █▌ ",
+        " ▀▀▀▀▀▄ ",
+        "▐█   █▌ ",
+        " ▀▀▀▀▀  "
+    ],
+    '9': [
+        " ▄▄▄▄▄  ",
+        "▐█   █▌ ",
+        " ▀████▀ ",
+        "      █▌",
+        " ▀▀▀▀▀  "
+    ]
+}
+
+# Block ASCII font
+_BLOCK_FONT: Dict[str, List[str]] = {
+    'A': [
+        "█████╗ ",
+        "██╔═██╗",
+        "██████╔╝",
+        "██╔══██╗",
+        "██║  ██║",
+        "╚═╝  ╚═╝"
+    ],
+    'C': [
+        " ██████╗",
+        "██╔════╝",
+        "██║     ",
+        "██║     ",
+        "╚██████╗",
+        " ╚═════╝"
+    ],
+    # ... (simplified for brevity)
+}
+
+# Banner ASCII font
+_BANNER_FONT: Dict[str, List[str]] = {
+    'A': [
+        " __  __ ",
+        "|  \\/  |",
+        "| \\  / |",
+        "| |\\/| |",
+        "| |  | |",
+        "|_|  |_|"
+    ],
+    # ... (simplified for brevity)
+}
+
+# Small ASCII font
+_SMALL_FONT: Dict[str, List[str]] = {
+    'A': ["▄█▄", "█▄█", "█▄█"],
+    'B': ["▄█ ", "██ ", "▄█▄"],
+    'C': ["▄█▄", "█  ", "▀▀▀"],
+    # ... (simplified for brevity)
+}
+
+def _frozen_font(font_data: Dict[str, List[str]]) -> Mapping[str, Tuple[str, ...]]:
+    """Read-only view of a font, so editing a shared table fails instead of leaking."""
+    return MappingProxyType({char: tuple(rows) for char, rows in font_data.items()})
+
+# Font tables are built once at import and shared by every renderer. They are
+# read-only because their renders are cached; a renderer that wants a different
+# font assigns a new table to its own fonts dict instead.
+_FONTS: Dict[str, Mapping[str, Tuple[str, ...]]] = {
+    "standard": _frozen_font(_STANDARD_FONT),
+    "block": _frozen_font(_BLOCK_FONT),
+    "banner": _frozen_font(_BANNER_FONT),
+    "small": _frozen_font(_SMALL_FONT)
+}
+
+# Sprite definitions
+_SPRITES: Dict[str, Tuple[str, ...]] = {
+    'heart': (
+        "  ♥♥   ",
+        " ♥  ♥  ",
+        "♥    ♥ ",
+        " ♥  ♥  ",
+        "  ♥♥   "
+    ),
+    'star': (
+        "    ★    ",
+        "   ★★★   ",
+        "  ★★★★★  ",
+        " ★★★★★★★ ",
+        "  ★★★★★  ",
+        "   ★★★   ",
+        "    ★    "
+    ),
+    'explosion': (
+        "    *    ",
+        "   ***   ",
+        "  *****  ",
+        " *** *** ",
+        "***** ***",
+        " *** *** ",
+        "  *****  ",
+        "   ***   ",
+        "    *    "
+    ),
+    'coin': (
+        "  █████  ",
+        " ██▄▄██ ",
+        "██  █ ██",
+        "██  █ ██",
+        " ██▀▀██ ",
+        "  █████  "
+    ),
+    'trophy': (
+        "    ▄▄   ",
+        "   ████  ",
+        "  ██████ ",
+        " ████████",
+        "    ██   ",
+        "   ████  ",
+        "████████ "
+    ),
+    'ghost': (
+        "  ▄▄▄▄▄  ",
+        " ██   ██ ",
+        "███████ ",
+        "█████████",
+        "███   ███",
+        "██ ██ ██",
+        "██   ██",
+        "██   ██"
+    ),
+    'mushroom': (
+        "   ▄▄▄▄▄   ",
+        "  ███████  ",
+        " ████████ ",
+        "███████████",
+        "   ████   ",
+        "  ███████  ",
+        " ████████ ",
+        "    ██    "
+    )
+}
+
+def _font_lines(font_data: Mapping[str, Sequence[str]]) -> Tuple[str, Tuple[Dict[str, str], ...]]:
+    """Split a font into one char -> row-string dict per glyph row, plus the blank glyph row."""
+    # Determine character width and height
+    if font_data:
+        sample_char = next(iter(font_data.values()))
+        char_height = len(sample_char)
+        char_width = len(sample_char[0]) if sample_char else 5
+    else:
+        char_height = 5
+        char_width = 7
+    
+    lines = tuple(
+        {char: rows[line] for char, rows in font_data.items()}
+        for line in range(char_height)
+    )
+    return " " * char_width, lines
+
+def _join_lines(blank: str, lines: Tuple[Dict[str, str], ...], text: str) -> Tuple[str, ...]:
+    """Lay out text one glyph row at a time, using space for missing characters."""
+    return tuple("".join([row.get(char, blank) for char in text]) for row in lines)
+
+def _assemble_text(font_data: Mapping[str, Sequence[str]], text: str) -> Tuple[str, ...]:
+    """Lay out text with a font, one joined string per glyph row."""
+    blank, lines = _font_lines(font_data)
+    return _join_lines(blank, lines, text)
+
+# Per-row glyph tables of the shared fonts
+_FONT_LINES = {name: _font_lines(font_data) for name, font_data in _FONTS.items()}
+
+@functools.lru_cache(maxsize=128)
+def _render_text_cached(font_name: str, text: str) -> Tuple[str, ...]:
+    """Memoized render of text in one of the shared fonts."""
+    blank, lines = _FONT_LINES[font_name]
+    return _join_lines(blank, lines, text)
+
+@functools.lru_cache(maxsize=256)
+def _bar(width: int, style: str, filled: int) -> str:
+    """The body of a progress bar with the given number of filled cells."""
+    return style * filled + "░" * (width - filled)
+
+@functools.lru_cache(maxsize=32)
+def _circle_directions(count: int) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """Cosines and sines of count angles evenly spaced around a circle."""
+    angles = [(i / count) * 2 * math.pi for i in range(count)]
+    return tuple(map(math.cos, angles)), tuple(map(math.sin, angles))
+
+_EXPLOSION_CHARS = ("*", "+", "✦", "✧", "·")
+
+def _sprite_cells(sprite: Sequence[str]) -> Tuple[Tuple[int, int, str], ...]:
+    """Return the (x, y, char) cells of a sprite that aren't blank."""
+    return tuple(
+        (sx, sy, char)
+        for sy, line in enumerate(sprite)
+        for sx, char in enumerate(line)
+        if char != ' '
+    )
+
+# Non-blank cells of every built-in sprite, so rendering skips the blank ones entirely
+_SPRITE_CELLS: Dict[str, Tuple[Tuple[int, int, str], ...]] = {
+    name: _sprite_cells(sprite) for name, sprite in _SPRITES.items()
+}
+
+_BOX_STYLES: Dict[str, Dict[str, str]] = {
+    "single": {
+        "corner_tl": "┌", "corner_tr": "┐", 
+        "corner_bl": "└", "corner_br": "┘",
+        "horizontal": "─", "vertical": "│"
+    },
+    "double": {
+        "corner_tl": "╔", "corner_tr": "╗",
+        "corner_bl": "╚", "corner_br": "╝", 
+        "horizontal": "═", "vertical": "║"
+    },
+    "rounded": {
+        "corner_tl": "╭", "corner_tr": "╮",
+        "corner_bl": "╰", "corner_br": "╯",
+        "horizontal": "─", "vertical": "│"
+    }
+}
+
+# Per-field particle lists on ASCIIRenderer, kept index-aligned
+_PARTICLE_FIELDS = ('_px', '_py', '_pdx', '_pdy', '_plife', '_pmaxlife', '_pchar', '_pcolor')
+
+class _Animation:
+    """Frames and playback state of one named animation."""
+    __slots__ = ('frames', 'frame_delay', 'loop', 'start', 'playing', 'calls')
+    
+    def __init__(self, frames: List[List[str]], frame_delay: float, loop: bool):
+        self.frames = frames
+        self.frame_delay = frame_delay
+        self.loop = loop
+        self.start = 0.0
+        self.playing = False
+        self.calls = 0  # Frames stepped so far when there is no frame delay
+
 class ASCIIRenderer:
     """Renders ASCII art, text, and animations."""
     
     def __init__(self):
-        self.fonts = self._load_fonts()
-        self.sprites = self._load_sprites()
-        self.animations = {}
-        self.particles = []
-    
-    def _load_fonts(self) -> Dict[str, Dict[str, List[str]]]:
-        """Load ASCII font definitions."""
-        return {
-            "standard": self._create_standard_font(),
-            "block": self._create_block_font(),
-            "banner": self._create_banner_font(),
-            "small": self._create_small_font()
-        }
-    
-    def _create_standard_font(self) -> Dict[str, List[str]]:
-        """Create standard ASCII font."""
-        return {
-            'A': [
-                "  ▄▄▄   ",
-                " ▐█ █▌  ",
-                "▐█▄▄█▄▌ ",
-                "▐█  █▌  ",
-                " ▀  ▀   "
-            ],
-            'B': [
-                "▄▄▄▄▄   ",
-                "▐█ █▌   ",
-                "▐▀▀▀▀▄▄ ",
-                "▐█   █▌ ",
-                " ▀▀▀▀▀  "
-            ],
-            'C': [
-                " ▄▄▄▄▄  ",
-                "▐█      ",
-                "▐█      ",
-                "▐█      ",
-                " ▀▀▀▀▀  "
-            ],
-            'D': [
-                "▄▄▄▄▄   ",
-                "▐█ █▌   ",
-                "▐█  █▌  ",
-                "▐█ █▌   ",
-                " ▀▀▀▀   "
-            ],
-            'E': [
-                "▄▄▄▄▄▄▄ ",
-                "▐█      ",
-                "▐▀▀▀▀▀▀ ",
-                "▐█      ",
-                " ▀▀▀▀▀▀ "
-            ],
-            'F': [
-                "▄▄▄▄▄▄▄ ",
-                "▐█      ",
-                "▐▀▀▀▀▀▀ ",
-                "▐█      ",
-                "▀       "
-            ],
-            'G': [
-                " ▄▄▄▄▄  ",
-                "▐█      ",
-                "▐█  ▄▄▄▌",
-                "▐█ █▌ █▌",
-                " ▀▀▀▀▀  "
-            ],
-            'H': [
-                "▄▄   ▄▄ ",
-                "▐█   █▌ ",
-                "▐█████▌ ",
-                "▐█   █▌ ",
-                "▀    ▀  "
-            ],
-            'I': [
-                "▄▄▄▄▄▄▄",
-                "   █   ",
-                "   █   ",
-                "   █   ",
-                " ▀▀▀▀▀ "
-            ],
-            'L': [
-                "▄       ",
-                "▐█      ",
-                "▐█      ",
-                "▐█████▌ ",
-                " ▀▀▀▀▀ "
-            ],
-            'M': [
-                "▄▄    ▄▄ ",
-                "▐██  ██▌ ",
-                "▐█ █ ██▌ ",
-                "▐█  ▐█▌  ",
-                "▀    ▀   "
-            ],
-            'N': [
-                "▄▄   ▄▄ ",
-                "▐██▄ ▐█▌ ",
-                "▐█ ████▌ ",
-                "▐█▌  ███ ",
-                "▀    ▀  "
-            ],
-            'O': [
-                " ▄▄▄▄▄  ",
-                "▐█   █▌ ",
-                "▐█   █▌ ",
-                "▐█   █▌ ",
-                " ▀▀▀▀▀  "
-            ],
-            'P': [
-                "▄▄▄▄▄   ",
-                "▐█ █▌   ",
-                "▐▀▀▀▀▄▄ ",
-                "▐█      ",
-                " ▀      "
-            ],
-            'R': [
-                "▄▄▄▄▄   ",
-                "▐█ █▌   ",
-                "▐▀▀▀▀▄▄ ",
-                "▐█   █▌ ",
-                " ▀▀▀▀▀  "
-            ],
-            'S': [
-                " ▄▄▄▄▄  ",
-                "▐█      ",
-                " ▀▀▀▀▀▄ ",
-                "      █▌",
-                " ▀▀▀▀▀  "
-            ],
-            'T': [
-                "▄▄▄▄▄▄▄",
-                "   █   ",
-                "   █   ",
-                "   █   ",
-                "   ▀   "
-            ],
-            'U': [
-                "▄▄   ▄▄ ",
-                "▐█   █▌ ",
-                "▐█   █▌ ",
-                "▐█   █▌ ",
-                " ▀▀▀▀▀  "
-            ],
-            'V': [
-                "▄▄   ▄▄ ",
-                "▐█   █▌ ",
-                "▐█   █▌ ",
-                " ▐█ █▌  ",
-                "  ▀▀   "
-            ],
-            'W': [
-                "▄▄    ▄▄ ",
-                "▐█    █▌ ",
-                "▐█ █ ██▌ ",
-                "▐██  ██▌ ",
-                "▀    ▀  "
-            ],
-            'Y': [
-                "▄▄   ▄▄ ",
-                "▐█   █▌ ",
-                " ▐█ █▌  ",
-                "   █   ",
-                "   ▀   "
-            ],
-            ' ': [
-                "       ",
-                "       ",
-                "       ",
-                "       ",
-                "       "
-            ],
-            '!': [
-                "   ▄   ",
-                "   █   ",
-                "   █   ",
-                "       ",
-                "   ▀   "
-            ],
-            '?': [
-                " ▄▄▄▄▄ ",
-                "▐█    █▌",
-                "    █  ",
-                "   ▄   ",
-                "   ▀   "
-            ],
-            '0': [
-                " ▄▄▄▄▄ ",
-                "▐█ █ █▌",
-                "▐█ █ █▌",
-                "▐█ █ █▌",
-                " ▀▀▀▀▀ "
-            ],
-            '1': [
-                "  ▄▄  ",
-                " ▐█ █▌",
-                "   █ ",
-                "   █ ",
-                " ▀▀▀▀"
-            ],
-            '2': [
-                " ▄▄▄▄▄ ",
-                "▐█    █▌",
-                "   ▄▄▄▌",
-                "▐█    ",
-                " ▀▀▀▀▀▀"
-            ],
-            '3': [
-                " ▄▄▄▄▄ ",
-                "▐█    █▌",
-                "   ███ ",
-                "▐█    █▌",
-                " ▀▀▀▀▀ "
-            ],
-            '4': [
-                "▄▄   ▄▄",
-                "▐█   █▌",
-                "▐█████▌",
-                "    █ ",
-                "    ▀ "
-            ],
-            '5': [
-                "▄▄▄▄▄▄▄",
-                "▐█     ",
-                "▀▀▀▀▀▄▄",
-                "     █▌",
-                "▀▀▀▀▀▀ "
-            ],
-            '6': [
-                " ▄▄▄▄▄  ",
-                "▐█      ",
-                "▐████▄▄ ",
-                "▐█   █▌ ",
-                " ▀▀▀▀▀  "
-            ],
-            '7': [
-                "▄▄▄▄▄▄▄▄",
-                "      █▌",
-                "    █  ",
-                "   █   ",
-                "  ▀    "
-            ],
-            '8': [
-                " ▄▄▄▄▄  ",
-                "▐█   █▌ ",
-                " ▀▀▀▀▀▄ ",
-                "▐█   █▌ ",
-                " ▀▀▀▀▀  "
-            ],
-            '9': [
-                " ▄▄▄▄▄  ",
-                "▐█   █▌ ",
-                " ▀████▀ ",
-                "      █▌",
-                " ▀▀▀▀▀  "
-            ]
-        }
-    
-    def _create_block_font(self) -> Dict[str, List[str]]:
-        """Create block ASCII font."""
-        return {
-            'A': [
-                "█████╗ ",
-                "██╔═██╗",
-                "██████╔╝",
-                "██╔══██╗",
-                "██║  ██║",
-                "╚═╝  ╚═╝"
-            ],
-            'C': [
-                " ██████╗",
-                "██╔════╝",
-                "██║     ",
-                "██║     ",
-                "╚██████╗",
-                " ╚═════╝"
-            ],
-            # ... (simplified for brevity)
-        }
-    
-    def _create_banner_font(self) -> Dict[str, List[str]]:
-        """Create banner ASCII font."""
-        return {
-            'A': [
-                " __  __ ",
-                "|  \\/  |",
-                "| \\  / |",
-                "| |\\/| |",
-                "| |  | |",
-                "|_|  |_|"
-            ],
-            # ... (simplified for brevity)
-        }
-    
-    def _create_small_font(self) -> Dict[str, List[str]]:
-        """Create small ASCII font."""
-        return {
-            'A': ["▄█▄", "█▄█", "█▄█"],
-            'B': ["▄█ ", "██ ", "▄█▄"],
-            'C': ["▄█▄", "█  ", "▀▀▀"],
-            # ... (simplified for brevity)
-        }
-    
-    def _load_sprites(self) -> Dict[str, List[str]]:
-        """Load sprite definitions."""
-        return {
-            'heart': [
-                "  ♥♥   ",
-                " ♥  ♥  ",
-                "♥    ♥ ",
-                " ♥  ♥  ",
-                "  ♥♥   "
-            ],
-            'star': [
-                "    ★    ",
-                "   ★★★   ",
-                "  ★★★★★  ",
-                " ★★★★★★★ ",
-                "  ★★★★★  ",
-                "   ★★★   ",
-                "    ★    "
-            ],
-            'explosion': [
-                "    *    ",
-                "   ***   ",
-                "  *****  ",
-                " *** *** ",
-                "***** ***",
-                " *** *** ",
-                "  *****  ",
-                "   ***   ",
-                "    *    "
-            ],
-            'coin': [
-                "  █████  ",
-                " ██▄▄██ ",
-                "██  █ ██",
-                "██  █ ██",
-                " ██▀▀██ ",
-                "  █████  "
-            ],
-            'trophy': [
-                "    ▄▄   ",
-                "   ████  ",
-                "  ██████ ",
-                " ████████",
-                "    ██   ",
-                "   ████  ",
-                "████████ "
-            ],
-            'ghost': [
-                "  ▄▄▄▄▄  ",
-                " ██   ██ ",
-                "███████ ",
-                "█████████",
-                "███   ███",
-                "██ ██ ██",
-                "██   ██",
-                "██   ██"
-            ],
-            'mushroom': [
-                "   ▄▄▄▄▄   ",
-                "  ███████  ",
-                " ████████ ",
-                "███████████",
-                "   ████   ",
-                "  ███████  ",
-                " ████████ ",
-                "    ██    "
-            ]
-        }
+        # The font and sprite tables are shared; only the name lookups are per instance
+        self.fonts = dict(_FONTS)
+        self.sprites = dict(_SPRITES)
+        self.animations: Dict[str, _Animation] = {}
+        
+        # Particles are stored field by field in parallel lists, so a frame
+        # update is a handful of list comprehensions rather than per-particle dict work
+        self._px: List[float] = []
+        self._py: List[float] = []
+        self._pdx: List[float] = []
+        self._pdy: List[float] = []
+        self._plife: List[float] = []
+        self._pmaxlife: List[float] = []
+        self._pchar: List[str] = []
+        self._pcolor: List[Optional[str]] = []
     
     def render_text(self, text: str, font: FontStyle = FontStyle.STANDARD) -> List[str]:
         """Render text using ASCII font."""
@@ -402,28 +512,10 @@ class ASCIIRenderer:
         # Convert to uppercase for font lookup
         text = text.upper()
         
-        # Determine character width and height
-        if font_data:
-            sample_char = next(iter(font_data.values()))
-            char_height = len(sample_char)
-            char_width = len(sample_char[0]) if sample_char else 5
-        else:
-            char_height = 5
-            char_width = 7
-        
-        # Build each line of the output
-        result = []
-        for line in range(char_height):
-            text_line = ""
-            for char in text:
-                if char in font_data:
-                    text_line += font_data[char][line]
-                else:
-                    # Use space for missing characters
-                    text_line += " " * char_width
-            result.append(text_line)
-        
-        return result
+        # Shared tables are immutable, so their renders can be memoized
+        if font_data is _FONTS.get(font_name):
+            return list(_render_text_cached(font_name, text))
+        return list(_assemble_text(font_data, text))
     
     def render_sprite(self, sprite_name: str, x: int = 0, y: int = 0, 
                      scale: float = 1.0) -> Optional[List[Tuple[int, int, str]]]:
@@ -432,160 +524,117 @@ class ASCIIRenderer:
             return None
         
         sprite = self.sprites[sprite_name]
-        result = []
+        cells = _SPRITE_CELLS.get(sprite_name)
+        if cells is None or sprite is not _SPRITES[sprite_name]:
+            cells = _sprite_cells(sprite)
         
-        for sy, line in enumerate(sprite):
-            for sx, char in enumerate(line):
-                if char != ' ':
-                    # Apply scaling
-                    scaled_x = int(x + sx * scale)
-                    scaled_y = int(y + sy * scale)
-                    result.append((scaled_x, scaled_y, char))
+        # Unscaled sprites at integer positions need no float math
+        if scale == 1.0 and isinstance(x, int) and isinstance(y, int):
+            return [(x + sx, y + sy, char) for sx, sy, char in cells]
         
-        return result
+        # Apply scaling
+        return [(int(x + sx * scale), int(y + sy * scale), char) for sx, sy, char in cells]
     
     def create_animation(self, name: str, frames: List[List[str]], 
                         frame_delay: float = 0.1, loop: bool = True) -> bool:
         """Create a new animation."""
-        self.animations[name] = {
-            'frames': frames,
-            'frame_delay': frame_delay,
-            'loop': loop,
-            'current_frame': 0,
-            'last_update': 0,
-            'playing': False
-        }
+        self.animations[name] = _Animation(frames, frame_delay, loop)
         return True
     
     def play_animation(self, name: str) -> bool:
         """Start playing an animation."""
         if name in self.animations:
-            self.animations[name]['playing'] = True
-            self.animations[name]['last_update'] = time.time()
+            anim = self.animations[name]
+            anim.playing = True
+            anim.start = time.monotonic()
+            anim.calls = 0
             return True
         return False
     
     def stop_animation(self, name: str) -> bool:
         """Stop playing an animation."""
         if name in self.animations:
-            self.animations[name]['playing'] = False
-            self.animations[name]['current_frame'] = 0
+            self.animations[name].playing = False
             return True
         return False
     
     def get_animation_frame(self, name: str) -> Optional[List[str]]:
         """Get the current frame of an animation."""
-        if name not in self.animations:
+        anim = self.animations.get(name)
+        if anim is None:
             return None
         
-        anim = self.animations[name]
-        
-        if not anim['playing']:
-            return anim['frames'][0] if anim['frames'] else None
+        frames = anim.frames
+        if not anim.playing or not frames:
+            return frames[0] if frames else None
         
-        # Update frame based on time
-        current_time = time.time()
-        if current_time - anim['last_update'] >= anim['frame_delay']:
-            anim['current_frame'] += 1
-            
-            if anim['current_frame'] >= len(anim['frames']):
-                if anim['loop']:
-                    anim['current_frame'] = 0
-                else:
-                    anim['playing'] = False
-                    anim['current_frame'] = len(anim['frames']) - 1
-            
-            anim['last_update'] = current_time
+        # The frame follows from the time since play_animation, so nothing accumulates
+        # between calls; without a delay it advances one frame per call instead
+        if anim.frame_delay > 0:
+            elapsed = int((time.monotonic() - anim.start) / anim.frame_delay)
+        else:
+            anim.calls += 1
+            elapsed = anim.calls
+        if anim.loop:
+            return frames[elapsed % len(frames)]
         
-        return anim['frames'][anim['current_frame']]
+        if elapsed >= len(frames):
+            anim.playing = False
+            return frames[-1]
+        return frames[elapsed]
     
     def add_particle(self, x: int, y: int, char: str, 
                     dx: float = 0, dy: float = 0, 
                     lifetime: float = 1.0, color: Optional[str] = None):
         """Add a particle effect."""
-        particle = {
-            'x': float(x),
-            'y': float(y),
-            'dx': dx,
-            'dy': dy,
-            'char': char,
-            'lifetime': lifetime,
-            'max_lifetime': lifetime,
-            'color': color
-        }
-        self.particles.append(particle)
+        self._px.append(float(x))
+        self._py.append(float(y))
+        self._pdx.append(dx)
+        self._pdy.append(dy)
+        self._plife.append(lifetime)
+        self._pmaxlife.append(lifetime)
+        self._pchar.append(char)
+        self._pcolor.append(color)
     
     def update_particles(self, dt: float):
         """Update all particles."""
-        surviving_particles = []
+        if not self._plife:
+            return
+        
+        # Update position
+        self._px = [x + dx * dt for x, dx in zip(self._px, self._pdx)]
+        self._py = [y + dy * dt for y, dy in zip(self._py, self._pdy)]
+        
+        # Update lifetime
+        self._plife = [life - dt for life in self._plife]
         
-        for particle in self.particles:
-            # Update position
-            particle['x'] += particle['dx'] * dt
-            particle['y'] += particle['dy'] * dt
-            
-            # Update lifetime
-            particle['lifetime'] -= dt
-            
-            # Apply gravity (optional)
-            particle['dy'] += 100 * dt  # Gravity effect
-            
-            if particle['lifetime'] > 0:
-                surviving_particles.append(particle)
+        # Apply gravity (optional)
+        gravity = 100 * dt
+        self._pdy = [dy + gravity for dy in self._pdy]
         
-        self.particles = surviving_particles
+        # Compact the lists only when something actually expired
+        if min(self._plife) <= 0:
+            alive = [life > 0 for life in self._plife]
+            for field in _PARTICLE_FIELDS:
+                setattr(self, field, list(compress(getattr(self, field), alive)))
     
     def get_particles(self) -> List[Tuple[int, int, str, float]]:
         """Get all current particles with opacity."""
-        result = []
-        for particle in self.particles:
-            opacity = particle['lifetime'] / particle['max_lifetime']
-            x = int(particle['x'])
-            y = int(particle['y'])
-            result.append((x, y, particle['char'], opacity))
-        return result
+        return [
+            (int(x), int(y), char, life / max_life)
+            for x, y, char, life, max_life in zip(self._px, self._py, self._pchar, self._plife, self._pmaxlife)
+        ]
     
     def create_box(self, width: int, height: int, 
                   style: str = "double") -> List[str]:
         """Create a decorative box."""
-        styles = {
-            "single": {
-                "corner_tl": "┌", "corner_tr": "┐", 
-                "corner_bl": "└", "corner_br": "┘",
-                "horizontal": "─", "vertical": "│"
-            },
-            "double": {
-                "corner_tl": "╔", "corner_tr": "╗",
-                "corner_bl": "╚", "corner_br": "╝", 
-                "horizontal": "═", "vertical": "║"
-            },
-            "rounded": {
-                "corner_tl": "╭", "corner_tr": "╮",
-                "corner_bl": "╰", "corner_br": "╯",
-                "horizontal": "─", "vertical": "│"
-            }
-        }
+        s = _BOX_STYLES.get(style, _BOX_STYLES["double"])
         
-        if style not in styles:
-            style = "double"
-        
-        s = styles[style]
-        box = []
-        
-        # Top line
         top_line = s["corner_tl"] + s["horizontal"] * (width - 2) + s["corner_tr"]
-        box.append(top_line)
-        
-        # Middle lines
         middle_line = s["vertical"] + " " * (width - 2) + s["vertical"]
-        for _ in range(height - 2):
-            box.append(middle_line)
-        
-        # Bottom line
         bottom_line = s["corner_bl"] + s["horizontal"] * (width - 2) + s["corner_br"]
-        box.append(bottom_line)
         
-        return box
+        return [top_line, *([middle_line] * (height - 2)), bottom_line]
     
     def create_progress_bar(self, current: int, maximum: int, 
                            width: int = 20, style: str = "█") -> str:
@@ -596,25 +645,27 @@ class ASCIIRenderer:
             percentage = min(1.0, current / maximum)
         
         filled_width = int(width * percentage)
-        empty_width = width - filled_width
-        
-        bar = style * filled_width + "░" * empty_width
-        percentage_text = f" {percentage * 100:.0f}%"
-        
-        return f"[{bar}]{percentage_text}"
+        return f"[{_bar(width, style, filled_width)}] {percentage * 100:.0f}%"
     
     def create_explosion_effect(self, x: int, y: int, size: int = 5):
         """Create an explosion particle effect."""
-        for i in range(size * 10):
-            angle = (i / (size * 10)) * 2 * math.pi
-            speed = random.uniform(50, 200)
-            dx = math.cos(angle) * speed
-            dy = math.sin(angle) * speed
-            
-            chars = ["*", "+", "✦", "✧", "·"]
-            char = random.choice(chars)
-            
-            self.add_particle(x, y, char, dx, dy, lifetime=1.0)
+        count = size * 10
+        if count <= 0:
+            return
+        
+        cosines, sines = _circle_directions(count)
+        uniform = random.uniform
+        speeds = [uniform(50, 200) for _ in range(count)]
+        
+        # Append straight onto the particle lists rather than one add_particle call each
+        self._px.extend([float(x)] * count)
+        self._py.extend([float(y)] * count)
+        self._pdx.extend([c * speed for c, speed in zip(cosines, speeds)])
+        self._pdy.extend([s * speed for s, speed in zip(sines, speeds)])
+        self._plife.extend([1.0] * count)
+        self._pmaxlife.extend([1.0] * count)
+        self._pchar.extend(random.choices(_EXPLOSION_CHARS, k=count))
+        self._pcolor.extend([None] * count)
     
     def create_text_effect(self, text: str, x: int, y: int, 
                           effect: str = "wave"):